@@ -7,6 +7,25 @@ def initVarCommon():
             "input_dir": Path("input"),
             "db_file": Path("data") / "database.db",
             "ifsc_dataset_path": Path("data") / "IFSC.csv",
+            "ifsc_index_path": Path("data") / "IFSC.idx",
+            "ifsc_socket_path": Path("data") / "ifsc.sock",
+            "ifsc_changes_dir": Path("data") / "IFSC changes",
+            "ifsc_hot_index_path": Path("data") / "IFSC.hot.idx",
+            "ifsc_hot_states": ["KERALA"],
+            "ifsc_hot_banks": [],
+            "form_prefetch": 4,
+            "form_timeout": 120,
+            "form_memory_limit": 1024,
+            "form_cache_path": Path("data") / "FormCache.db",
+            "form_index_path": Path("data") / "FormIndex.db",
+            "session_dir": Path("data") / "sessions",
+            "batch_rules": {
+                "valid_ifsc": True,
+                "known_class": True,
+                "district_majority": True,
+                "no_duplicates": True,
+            },
+            "watch_auto_accept": False,
             "district_dataset": loadDistrictDataset(),
         }
     """
@@ -14,6 +33,25 @@ def initVarCommon():
         "input_dir": Path("input"),
         "db_file": Path("data") / "database.db",
         "ifsc_dataset_path": Path("data") / "IFSC.csv",
+        "ifsc_index_path": Path("data") / "IFSC.idx",
+        "ifsc_socket_path": Path("data") / "ifsc.sock",
+        "ifsc_changes_dir": Path("data") / "IFSC changes",
+        "ifsc_hot_index_path": Path("data") / "IFSC.hot.idx",
+        "ifsc_hot_states": ["KERALA"],
+        "ifsc_hot_banks": [],
+        "form_prefetch": 4,
+        "form_timeout": 120,
+        "form_memory_limit": 1024,
+        "form_cache_path": Path("data") / "FormCache.db",
+        "form_index_path": Path("data") / "FormIndex.db",
+        "session_dir": Path("data") / "sessions",
+        "batch_rules": {
+            "valid_ifsc": True,
+            "known_class": True,
+            "district_majority": True,
+            "no_duplicates": True,
+        },
+        "watch_auto_accept": False,
         "district_dataset": loadDistrictDataset(),
     }
     return var
@@ -26,19 +64,29 @@ def initVarCmd():
         cmd = {
             "db": "database",
             "form": "forms",
+            "batch": "forms-batch",
+            "watch": "forms-watch",
+            "validate": "validate",
             "ifsc": "ifsc",
             "excel": "spreadsheet",
             "bank": "neft",
             "final": "final",
+            "daemon": "ifsc-daemon",
+            "update": "ifsc-update",
         }
     """
     cmd = {
         "db": "database",
         "form": "forms",
+        "batch": "forms-batch",
+        "watch": "forms-watch",
+        "validate": "validate",
         "ifsc": "ifsc",
         "excel": "spreadsheet",
         "bank": "neft",
         "final": "final",
+        "daemon": "ifsc-daemon",
+        "update": "ifsc-update",
     }
     return cmd
 
@@ -1,8 +1,56 @@
+import hashlib
+import json
 from django.shortcuts import render
 from django.http import HttpResponse
 from .forms import InstitutionForm, StudentFormSet
 from .models import Institution
 
+# Package relationship Scholar CAP looks up to read the embedded form data
+FORM_DATA = "https://github.com/MidHunterX/Scholar-CAP/relationships/formData"
+FORM_DATA_VERSION = 1
+
+
+def embed_form_data(doc, institution, students):
+    """
+    Stores the institution and student values in the docx as a JSON part,
+    so Scholar CAP reads them directly instead of scraping the document.
+    Call after the document content is complete: the part records a hash
+    of the document, and Scholar CAP ignores it once the document changes.
+    """
+    from docx.opc.packuri import PackURI
+    from docx.opc.part import Part
+
+    data = {
+        "version": FORM_DATA_VERSION,
+        "document_sha256": hashlib.sha256(doc.part.blob).hexdigest(),
+        "institution": {
+            "name": institution.name,
+            "place": institution.place,
+            "district": institution.district,
+            "number": institution.phone_no,
+            "email": institution.email,
+        },
+        "students": [
+            {
+                "name": student.student_name,
+                "standard": student.student_class,
+                "ifsc": student.student_ifsc,
+                "acc_no": student.student_account,
+                "holder": student.student_holder,
+                "branch": student.student_branch,
+            }
+            for student in students
+        ],
+    }
+    package = doc.part.package
+    part = Part(
+        PackURI("/customXml/scholarCapFormData.json"),
+        "application/json",
+        json.dumps(data, ensure_ascii=False).encode("utf-8"),
+        package,
+    )
+    package.relate_to(part, FORM_DATA)
+
 
 def generate_docx(request):
     if request.method == "POST":
@@ -53,6 +101,9 @@ def generate_docx(request):
                 row_cells[4].text = student.student_holder
                 row_cells[5].text = student.student_branch
 
+            # Machine readable copy of the values for Scholar CAP
+            embed_form_data(doc, institution, students)
+
             # Save the document with the institution name as the filename
             filename = institution.name.replace(" ", "_") + ".docx"
             doc.save(filename)
@@ -0,0 +1,71 @@
+import sqlite3      # Cache storage
+import pickle       # Parser results serialization
+import os           # Per process connections
+from pathlib import Path            # OS Independent filepath
+
+# Bump whenever a parser starts returning different results for the same form
+PARSER_VERSION = 3
+
+
+# ============================ [ @CACHE_CLASSES ] ============================ #
+
+
+class FormCache:
+    """
+    Parser results of every form seen, keyed by the SHA-256 of its content,
+    so a form moved or renamed between commands is never parsed twice.
+
+    Rows are (Hash, Key, Value) where Key names the parser ("format",
+    "institution", "students") and Value is its pickled result. The cache
+    is best effort: if the file can't be used, forms are parsed as usual.
+    """
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.conn = None
+        self.pid = None
+
+    def connect(self):
+        # sqlite3 connections must not be shared with forked workers
+        if self.conn is None or self.pid != os.getpid():
+            Path(self.cache_file).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.cache_file, timeout=30)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS FormCache (
+                Hash    TEXT NOT NULL,
+                Key     TEXT NOT NULL,
+                Version INTEGER NOT NULL,
+                Value   BLOB NOT NULL,
+                PRIMARY KEY (Hash, Key)
+            )
+            """)
+            self.pid = os.getpid()
+        return self.conn
+
+    def get(self, digest, key):
+        """
+        Returns: (True, value) if cached by the current PARSER_VERSION,
+                 (False, None) otherwise
+        """
+        try:
+            row = self.connect().execute(
+                "SELECT Value FROM FormCache WHERE Hash = ? AND Key = ? AND Version = ?",
+                (digest, key, PARSER_VERSION),
+            ).fetchone()
+        except sqlite3.Error:
+            return False, None
+        if row is None:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def put(self, digest, key, value):
+        try:
+            conn = self.connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO FormCache VALUES (?, ?, ?, ?)",
+                (digest, key, PARSER_VERSION, pickle.dumps(value)),
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
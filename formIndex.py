@@ -0,0 +1,200 @@
+import sqlite3      # Index storage
+import hashlib      # Content hash
+import datetime     # First seen time
+import shutil       # Moving duplicates
+import os           # Duplicate checks
+import re           # Name normalization
+from pathlib import Path            # OS Independent filepath
+import formParser   # Raw file hash
+
+
+# ============================ [ @INDEX_CLASSES ] ============================ #
+
+
+class FormIndex:
+    """
+    Every form that left the input directory, across sessions, by the
+    SHA-256 of its file and by getContentHash() of its students, with the
+    path it was last moved to and whether it was accepted there:
+
+    FormIndex (Hash, ContentHash, File, FirstSeen, LastMoved, Accepted)
+    """
+
+    def __init__(self, index_file):
+        self.index_file = index_file
+        self.conn = None
+
+    def connect(self):
+        if self.conn is None:
+            Path(self.index_file).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(self.index_file, timeout=30)
+            self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS FormIndex (
+                Hash        TEXT PRIMARY KEY,
+                ContentHash TEXT,
+                File        TEXT NOT NULL,
+                FirstSeen   TEXT NOT NULL,
+                LastMoved   TEXT NOT NULL DEFAULT '',
+                Accepted    INTEGER NOT NULL DEFAULT 0
+            )
+            """)
+            # Indexes from before LastMoved / Accepted
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(FormIndex)")]
+            for column in ("LastMoved TEXT NOT NULL DEFAULT ''", "Accepted INTEGER NOT NULL DEFAULT 0"):
+                if column.split()[0] not in columns:
+                    self.conn.execute(f"ALTER TABLE FormIndex ADD COLUMN {column}")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS FormIndexContent ON FormIndex (ContentHash)"
+            )
+        return self.conn
+
+    def find(self, digest=None, content_hash=None):
+        """
+        Returns: Paths of indexed forms, last moved first. By file hash any
+                 form, by content hash only accepted forms (empty list if
+                 there are none)
+        """
+        if digest is not None:
+            query, value = "SELECT File FROM FormIndex WHERE Hash = ?", digest
+        elif content_hash is not None:
+            query = """
+            SELECT File FROM FormIndex WHERE ContentHash = ? AND Accepted = 1
+            ORDER BY LastMoved DESC
+            """
+            value = content_hash
+        else:
+            return []
+        return [row[0] for row in self.connect().execute(query, (value,))]
+
+    def add(self, digest, content_hash, file, accepted=False):
+        """
+        Indexes the form, or notes where it was moved if already indexed.
+        accepted is where the form stands after this move (eg: a form
+        rejected by `database` stops being accepted).
+        """
+        conn = self.connect()
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        conn.execute(
+            """
+            INSERT INTO FormIndex VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (Hash) DO UPDATE SET
+                File = excluded.File,
+                ContentHash = COALESCE(excluded.ContentHash, ContentHash),
+                LastMoved = excluded.LastMoved,
+                Accepted = excluded.Accepted
+            """,
+            (digest, content_hash, str(file), now, now, int(accepted)),
+        )
+        conn.commit()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class FormDeduplicator:
+    """
+    Collapses copies of a form arriving in one intake run or in a later one.
+
+    filterFiles() moves files with the same bytes as another form to
+    duplicates_dir before they are parsed. checkResult() does the same after
+    parsing for forms whose students match an accepted form's (eg: the DOCX
+    and PDF of one form), so a resubmission of a form that went for checking
+    or was rejected still reaches the operator. A form only counts as the
+    original while its indexed file still exists, so a form moved back into
+    the input directory is processed again rather than called a copy of
+    itself.
+    """
+
+    def __init__(self, form_index, duplicates_dir):
+        self.form_index = form_index
+        self.duplicates_dir = duplicates_dir
+        self.files = {}     # {hash: file} seen in this run
+        self.count = 0
+
+    def filterFiles(self, file_list):
+        """
+        Yields: Files of file_list that aren't copies of another form
+        """
+        for file in file_list:
+            try:
+                digest = formParser.FormDocument(file).getHash()
+            except OSError:
+                yield file  # Let the parser report it
+                continue
+            original = self.getOriginal(file, self.files.get(digest), *self.form_index.find(digest=digest))
+            if original:
+                self.moveDuplicate(file, f"Same file as {original}")
+                continue
+            self.files[digest] = file
+            yield file
+
+    def checkResult(self, result):
+        """
+        Returns: True if the parsed form was a copy of another form and got
+                 moved to duplicates_dir
+        """
+        content_hash = result.get("content_hash")
+        if not content_hash:
+            return False
+        file = result["file"]
+        original = self.getOriginal(file, *self.form_index.find(content_hash=content_hash))
+        if original:
+            self.moveDuplicate(file, f"Same students as accepted {original}")
+            return True
+        return False
+
+    def register(self, file, content_hash, accepted=False):
+        """
+        Indexes a form that left the input directory (file: where it went)
+        """
+        digest = formParser.FormDocument(file).getHash()
+        self.form_index.add(digest, content_hash, file, accepted)
+
+    def getOriginal(self, file, *candidates):
+        """
+        Returns: First candidate that still exists and isn't file itself
+        """
+        for candidate in candidates:
+            if candidate and os.path.exists(candidate) and not os.path.samefile(candidate, file):
+                return candidate
+        return None
+
+    def moveDuplicate(self, file, reason):
+        print(f"♻️ Duplicate: {os.path.basename(file)} ({reason})")
+        timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+        log_file = os.path.join(self.duplicates_dir, "reasons.log")
+        with open(log_file, mode='a', encoding='utf-8') as log:
+            log.write(f"{timestamp}\t{os.path.basename(file)}\t{reason}\n")
+        shutil.move(file, self.duplicates_dir)
+        self.count += 1
+
+
+# =========================== [ @INDEX_FUNCTIONS ] =========================== #
+
+
+def getContentHash(student_data):
+    """
+    Parameter: Cleaned and normalized student data
+    Returns: SHA-256 of the students, the same for every copy of a form
+             whatever its file type or layout (None if there are none)
+
+    Students are hashed sorted by account number, with names reduced to
+    lowercase letters and digits, so spacing and case don't matter.
+    """
+    if not student_data:
+        return None
+    students = sorted(
+        (
+            str(acc_no).strip(),
+            str(ifsc).strip().upper(),
+            re.sub(r"[^a-z0-9]", "", str(name).lower()),
+            str(standard).strip().lower(),
+        )
+        for name, standard, ifsc, acc_no, _, _ in student_data.values()
+    )
+    digest = hashlib.sha256()
+    for student in students:
+        digest.update("\x1f".join(student).encode("utf-8") + b"\x1e")
+    return digest.hexdigest()
@@ -0,0 +1,507 @@
+import os           # Directory path support
+import hashlib      # Content hash for the parse cache
+import json         # Embedded form data
+import zipfile      # DOCX package
+import docx         # Docx parsing
+import pdfplumber   # PDF parsing
+import xml.etree.ElementTree as ET  # Streaming DOCX XML
+from pdfminer.pdftypes import resolve1  # AcroForm object references
+from pdfminer.psparser import PSLiteral  # AcroForm name values
+from pdfminer.utils import decode_text  # AcroForm text strings
+from concurrent.futures import ProcessPoolExecutor  # Page parallel tables
+
+# WordprocessingML namespace, as ElementTree writes tags
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+# Package relationship of the form data embedded by create_forms
+FORM_DATA = "https://github.com/MidHunterX/Scholar-CAP/relationships/formData"
+# Embedded form data layout readDocxPayload() understands
+FORM_DATA_VERSION = 1
+
+# Pages looked at to reject a PDF before extracting it
+PRECHECK_PAGES = 2
+# Headings every form has near its start
+FORM_MARKERS = ("Institution Details", "Student Details")
+# Deepest AcroForm field tree followed (guards against reference loops)
+MAX_FIELD_DEPTH = 10
+# PDFs with at least this many pages get their tables extracted in parallel
+PARALLEL_PAGE_COUNT = 12
+# Processes extracting the tables of one PDF (lowered in formPipeline workers)
+page_workers = os.cpu_count() or 1
+
+
+# =========================== [ @FORM_CLASSES ] =========================== #
+
+
+class FormDocument:
+    """
+    Supported form (DOCX / PDF) read from disk only once.
+
+    The first load() opens the file and extracts everything the parser
+    functions look at, so format validation, institution details and
+    student details all read from memory afterwards:
+
+    - DOCX: paragraphs = [text, ...]
+            tables = [[[cell_text, ...], ...], ...] (table -> row -> cell)
+    - PDF:  pages = [(text, table), ...] from extract_text(), extract_table()
+            (text is "" for pages after the one holding "Student Details")
+    - Fillable PDF: fields = {field_name: value} from the AcroForm, its
+            pages are not extracted at all
+    - Generated DOCX: payload = institution and students embedded by
+            create_forms, its document is not parsed at all
+
+    A PDF is opened once for the AcroForm check, the rejection check and
+    the extraction, and closed once they no longer need it (or by close()).
+    """
+
+    def __init__(self, file):
+        self.file = file
+        # None when the name has no / more than one dot (eg: "St. Mary.pdf")
+        parts = os.path.basename(file).split(".")
+        self.extension = parts[1] if len(parts) == 2 else None
+        self.paragraphs = None
+        self.tables = None
+        self.pages = None
+        self.fields = None
+        self.payload = None
+        self.digest = None
+        self.rejection = False
+        self.pdf = None
+
+    def getHash(self):
+        """
+        Returns: SHA-256 hex digest of the file contents, read only once
+        """
+        if self.digest is None:
+            digest = hashlib.sha256()
+            with open(self.file, mode='rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            self.digest = digest.hexdigest()
+        return self.digest
+
+    def getRejection(self):
+        """
+        Returns: Why the file can't be a form, found without extracting it
+                 (None if it may be one, only PDFs are checked)
+        """
+        if self.rejection is False:
+            self.rejection = None
+            if self.extension == "pdf" and not self.loadFields():
+                self.rejection = classifyPdf(self.openPdf())
+                if self.rejection is not None:
+                    self.close()
+        return self.rejection
+
+    def loadFields(self):
+        """
+        Returns: AcroForm fields of a fillable PDF ({} for flat PDFs)
+        """
+        if self.fields is None:
+            self.fields = readAcroForm(self.openPdf()) if self.extension == "pdf" else {}
+            # Fillable PDFs are read from their fields alone
+            if self.fields:
+                self.close()
+        return self.fields
+
+    def loadPayload(self):
+        """
+        Returns: Form data embedded in a generated DOCX ({} for other forms,
+                 or when the document was edited after it was generated)
+        """
+        if self.payload is None:
+            self.payload = readDocxPayload(self.file) if self.extension == "docx" else {}
+        return self.payload
+
+    def load(self):
+        """
+        Opens and extracts the file if it was not already
+        Returns: self
+        """
+        if self.extension == "docx" and self.paragraphs is None:
+            try:
+                self.paragraphs, self.tables = readDocx(self.file)
+            except (KeyError, ET.ParseError, zipfile.BadZipFile, ValueError, IndexError):
+                # Let python-docx deal with (or report) unusual packages
+                self.paragraphs, self.tables = readDocxObjectModel(self.file)
+
+        # Table extraction is only needed for flat PDFs
+        if self.extension == "pdf" and self.pages is None and not self.loadFields():
+            try:
+                self.pages = readPdf(self.openPdf(), self.file)
+            finally:
+                self.close()
+
+        return self
+
+    def openPdf(self):
+        """
+        Returns: pdfplumber PDF of the file, opened on first use
+        """
+        if self.pdf is None:
+            self.pdf = pdfplumber.open(self.file)
+            # Don't keep every parsed PDF object (content streams, fonts) alive
+            self.pdf.doc.caching = False
+        return self.pdf
+
+    def close(self):
+        if self.pdf is not None:
+            self.pdf.close()
+            self.pdf = None
+
+
+# =========================== [ @PDF_FUNCTIONS ] =========================== #
+
+
+def readAcroForm(pdf):
+    """
+    Parameter: Opened pdfplumber PDF
+    Returns: {field_name: value} for every field of a fillable PDF,
+             {} if the PDF has no AcroForm
+
+    Names of nested fields are joined with "." (eg: "Row1.IFSC"), values
+    are plain strings ("" when unfilled).
+    """
+    fields = {}
+    acro_form = resolve1(pdf.doc.catalog.get("AcroForm"))
+    if isinstance(acro_form, dict):
+        for field in resolve1(acro_form.get("Fields")) or []:
+            collectAcroFormFields(resolve1(field), "", fields, 0)
+    return fields
+
+
+def collectAcroFormFields(field, parent_name, fields, depth):
+    if not isinstance(field, dict) or depth > MAX_FIELD_DEPTH:
+        return
+
+    name = getAcroFormValue(field.get("T"))
+    if parent_name and name:
+        name = f"{parent_name}.{name}"
+    else:
+        name = name or parent_name
+
+    kids = resolve1(field.get("Kids"))
+    if kids:
+        for kid in kids:
+            collectAcroFormFields(resolve1(kid), name, fields, depth + 1)
+    # Widgets without their own name share the value of their parent field
+    if name and ("V" in field or not kids):
+        fields[name] = getAcroFormValue(field.get("V"))
+
+
+def getAcroFormValue(value):
+    """
+    Returns: AcroForm string, name or number as a str ("" if missing)
+    """
+    value = resolve1(value)
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return decode_text(value)
+    if isinstance(value, PSLiteral):
+        name = value.name
+        return name.decode("latin-1") if isinstance(name, bytes) else name
+    if isinstance(value, list):
+        return ", ".join(getAcroFormValue(item) for item in value)
+    return str(value)
+
+
+def classifyPdf(pdf):
+    """
+    Parameter: Opened pdfplumber PDF
+    Returns:
+        - None: If the PDF looks like a form
+        - reason: If it obviously isn't one (no pages, no text layer, or no
+          FORM_MARKERS in the first PRECHECK_PAGES pages)
+
+    Only reads the characters of the first pages, skipping the text layout
+    and table finding that make extraction slow.
+    """
+    text = ""
+    if not pdf.pages:
+        return "PDF has no pages"
+    for page in pdf.pages[:PRECHECK_PAGES]:
+        # Spaces may or may not be drawn as characters, compare without
+        text += "".join(char["text"].strip() for char in page.chars)
+        page.flush_cache()
+        if all(marker.replace(" ", "") in text for marker in FORM_MARKERS):
+            return None
+
+    if not text:
+        return "No text layer (scanned or image only PDF)"
+
+    missing = [marker for marker in FORM_MARKERS if marker.replace(" ", "") not in text]
+    if missing:
+        return f"Not found in first {PRECHECK_PAGES} pages: {', '.join(missing)}"
+    return None
+
+
+def readPdf(pdf, pdf_file):
+    """
+    Arguments: (pdf, pdf_file)
+        - pdf: Opened pdfplumber PDF of pdf_file
+        - pdf_file: Document.pdf file, opened again by the table workers
+    Returns: [(text, table), ...] for every page
+
+    Pages are extracted one at a time and their cached chars, objects and
+    layout are dropped right after, so memory stays flat however long the
+    form is. Text is only needed up to the "Student Details" heading, the
+    pages after it only have their table extracted.
+
+    Tables of long PDFs (PARALLEL_PAGE_COUNT pages) are extracted by
+    page_workers processes, each taking a range of pages, and put back in
+    page order while this process reads the text.
+    """
+    texts = []
+    tables = []
+    student_heading = False
+
+    page_count = len(pdf.pages)
+    workers = min(page_workers, page_count // 2)
+    parallel = workers > 1 and page_count >= PARALLEL_PAGE_COUNT
+
+    pool = None
+    if parallel:
+        pool = ProcessPoolExecutor(workers)
+        page_ranges = getPageRanges(page_count, workers)
+        chunks = pool.map(readPdfTables, [pdf_file] * len(page_ranges), page_ranges)
+
+    try:
+        for page in pdf.pages:
+            if parallel and student_heading:
+                break
+            text = ""
+            if not student_heading:
+                text = page.extract_text()
+                student_heading = "Student Details" in text
+            texts.append(text)
+            if not parallel:
+                tables.append(page.extract_table())
+            page.flush_cache()
+
+        if parallel:
+            for chunk in chunks:
+                tables.extend(chunk)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    texts.extend([""] * (page_count - len(texts)))
+    return list(zip(texts, tables))
+
+
+def readPdfTables(pdf_file, page_range):
+    """
+    Arguments: (pdf_file, page_range)
+    Returns: [table, ...] from extract_table() for pages start to end - 1
+    """
+    start, end = page_range
+    tables = []
+    with pdfplumber.open(pdf_file) as pdf:
+        pdf.doc.caching = False
+        for page in pdf.pages[start:end]:
+            tables.append(page.extract_table())
+            page.flush_cache()
+    return tables
+
+
+def getPageRanges(page_count, workers):
+    """
+    Returns: [(start, end), ...] covering every page in order, two ranges
+    per worker so a slow range doesn't leave the other workers idle
+    """
+    size = -(-page_count // (workers * 2))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+# =========================== [ @DOCX_FUNCTIONS ] =========================== #
+
+
+def readDocx(docx_file):
+    """
+    Parameter: Document.docx file
+    Returns: (paragraphs, tables) with the same texts python-docx gives
+
+    paragraphs = [paragraph.text for paragraph in doc.paragraphs]
+    tables = [[[cell.text for cell in row.cells] for row in table.rows] for table in doc.tables]
+
+    Streams the main document part of the zip with iterparse, handling one
+    top level paragraph or table at a time and dropping it afterwards,
+    instead of building the python-docx object model.
+    """
+    paragraphs = []
+    tables = []
+
+    with zipfile.ZipFile(docx_file) as package:
+        with package.open(getMainPartName(package)) as xml:
+            depth = 0
+            body = None
+            for event, element in ET.iterparse(xml, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    # <w:document> -> <w:body> -> paragraphs and tables
+                    if depth == 2:
+                        body = element
+                    continue
+
+                if depth == 3:
+                    if element.tag == W + "p":
+                        paragraphs.append(getParagraphText(element))
+                    elif element.tag == W + "tbl":
+                        tables.append(getTableRows(element))
+                    body.remove(element)
+                depth -= 1
+
+    return paragraphs, tables
+
+
+def readDocxObjectModel(docx_file):
+    """
+    Parameter: Document.docx file
+    Returns: (paragraphs, tables) like readDocx(), read through python-docx
+    """
+    doc = docx.Document(docx_file)
+    paragraphs = [paragraph.text for paragraph in doc.paragraphs]
+    tables = [
+        [[cell.text for cell in row.cells] for row in table.rows]
+        for table in doc.tables
+    ]
+    return paragraphs, tables
+
+
+def readDocxPayload(docx_file):
+    """
+    Parameter: Document.docx file
+    Returns: Form data embedded by create_forms, {} if there is none
+
+    payload = {
+        "institution": {"name": ..., "place": ..., "number": ..., "email": ...},
+        "students": [(name, standard, ifsc, acc_no, holder, branch), ...]
+    }
+
+    The payload records the SHA-256 of the document part it was written
+    with. If the document was edited since (eg: a student added in Word),
+    the payload is stale and ignored, so the form is read from its text.
+    """
+    try:
+        with zipfile.ZipFile(docx_file) as package:
+            payload_name = getPackagePartName(package, FORM_DATA)
+            if payload_name is None:
+                return {}
+            with package.open(payload_name) as file:
+                data = json.load(file)
+            digest = hashlib.sha256(package.read(getMainPartName(package))).hexdigest()
+    except (KeyError, ET.ParseError, zipfile.BadZipFile, ValueError):
+        return {}
+
+    try:
+        if data["version"] != FORM_DATA_VERSION or data["document_sha256"] != digest:
+            return {}
+        institution = {key: str(data["institution"][key]) for key in ("name", "place", "number", "email")}
+        students = [
+            tuple(str(student[key]) for key in ("name", "standard", "ifsc", "acc_no", "holder", "branch"))
+            for student in data["students"]
+            if student["name"]
+        ]
+    except (KeyError, TypeError):
+        return {}
+    return {"institution": institution, "students": students}
+
+
+def getPackagePartName(package, relationship_type):
+    """
+    Parameters: (DOCX zipfile.ZipFile, package relationship type)
+    Returns: Name of the part the relationship points at (None if missing)
+    """
+    with package.open("_rels/.rels") as xml:
+        for relationship in ET.parse(xml).getroot().iter(RELS + "Relationship"):
+            if relationship.get("Type") == relationship_type:
+                return relationship.get("Target").lstrip("/")
+    return None
+
+
+def getMainPartName(package):
+    """
+    Parameter: DOCX zipfile.ZipFile
+    Returns: Name of the main document part (usually "word/document.xml")
+    """
+    name = getPackagePartName(package, OFFICE_DOCUMENT)
+    if name is None:
+        raise KeyError("officeDocument relationship not found")
+    return name
+
+
+def getRunText(run):
+    """
+    Parameter: <w:r> element
+    Returns: Text of the run, tabs and line breaks included
+    """
+    text = []
+    for child in run:
+        tag = child.tag
+        if tag == W + "t":
+            text.append(child.text or "")
+        elif tag == W + "tab" or tag == W + "ptab":
+            text.append("\t")
+        elif tag == W + "cr":
+            text.append("\n")
+        elif tag == W + "br":
+            # Page and column breaks carry no text
+            if child.get(W + "type", "textWrapping") == "textWrapping":
+                text.append("\n")
+        elif tag == W + "noBreakHyphen":
+            text.append("-")
+    return "".join(text)
+
+
+def getParagraphText(paragraph):
+    """
+    Parameter: <w:p> element
+    Returns: Text of its runs, including runs inside hyperlinks
+    """
+    text = []
+    for child in paragraph:
+        if child.tag == W + "r":
+            text.append(getRunText(child))
+        elif child.tag == W + "hyperlink":
+            for run in child.findall(W + "r"):
+                text.append(getRunText(run))
+    return "".join(text)
+
+
+def getTableRows(table):
+    """
+    Parameter: <w:tbl> element
+    Returns: Rows of cell texts laid out on the table grid like row.cells
+
+    A cell spanning columns (gridSpan) repeats its text in every column it
+    covers, a vertically merged cell (vMerge) repeats the text of the cell
+    above it. Tables nested in a cell are not part of the cell text.
+    """
+    grid = table.find(W + "tblGrid")
+    column_count = len(grid.findall(W + "gridCol")) if grid is not None else 0
+    rows = table.findall(W + "tr")
+
+    cells = []
+    for row in rows:
+        for cell in row.findall(W + "tc"):
+            span = 1
+            merge = None
+            properties = cell.find(W + "tcPr")
+            if properties is not None:
+                grid_span = properties.find(W + "gridSpan")
+                if grid_span is not None:
+                    span = int(grid_span.get(W + "val"))
+                v_merge = properties.find(W + "vMerge")
+                if v_merge is not None:
+                    merge = v_merge.get(W + "val", "continue")
+
+            text = "\n".join(getParagraphText(p) for p in cell.findall(W + "p"))
+            for _ in range(span):
+                if merge == "continue":
+                    cells.append(cells[-column_count])
+                else:
+                    cells.append(text)
+
+    return [cells[i * column_count:(i + 1) * column_count] for i in range(len(rows))]
@@ -0,0 +1,410 @@
+import os           # CPU count and devnull
+import io           # Capturing worker output
+import time         # Parse deadlines
+import signal       # Leaving Ctrl+C to the operator process
+import contextlib   # stdout redirection
+import itertools    # Files added while running
+import atexit       # Closing forgotten pipelines
+import weakref      # Closing forgotten pipelines
+import multiprocessing                      # Isolated parse workers
+from multiprocessing.connection import wait  # Waiting on workers and deadlines
+from collections import deque               # Forms waiting for a worker
+import formParser   # Page parallel PDF tables
+import formIndex    # Content hash of the students
+import function as fn
+
+try:
+    import resource     # Worker memory limit (not available on Windows)
+except ImportError:
+    resource = None
+
+
+# ========================== [ @PIPELINE_CLASSES ] ========================== #
+
+
+class FormPipeline:
+    """
+    Parses forms in isolated worker processes ahead of the operator.
+
+    Up to `prefetch` forms are parsed, cleaned, normalized and district
+    guessed in the background, and results are handed out in the order of
+    file_list, so the interactive loop only waits if it outruns the pool.
+    prefetch=None queues every file at once to use all cores.
+
+    file_list may be any iterable (eg: fn.scanFiles()), it is only read as
+    far as prefetch needs, so parsing starts before discovery is done.
+    Long running callers (eg: formWatcher) add() files as they turn up and
+    take results with getFinished() instead of iterating.
+
+    Every parse runs under a watchdog: a worker taking longer than
+    `timeout` seconds is killed and replaced, a worker going over
+    `memory_limit` MB fails with MemoryError, and a worker that dies is
+    replaced. The form gets a result with "error" set to the reason and the
+    rest of the queue carries on.
+
+    With a sessionJournal.SessionJournal, every result is journaled with
+    the form's hash (result["hash"], None if the file couldn't be read and
+    for pipelines without a journal) and forms parsed by an earlier run of
+    the session are handed out from the journal without parsing. Workers
+    are only started once a form needs parsing.
+
+    with FormPipeline(file_list, prefetch=4, timeout=120) as pipeline:
+        for result in pipeline:
+            ...
+    """
+
+    def __init__(self, file_list, prefetch=None, workers=None, timeout=None, memory_limit=None, journal=None):
+        self.files = iter(file_list)
+        self.files_left = True
+        self.prefetch = prefetch
+        workers = workers or os.cpu_count() or 1
+        self.workers = max(1, min(workers, prefetch or workers))
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.journal = journal
+        self.pool = None
+        self.prepared = False
+        self.queue = deque()
+        self.results = {}
+        self.hashes = {}
+        self.next_index = 0
+
+    def start(self):
+        """
+        Queues the first files, starting workers for them
+        """
+        if self.pool is None:
+            self.pool = []
+            # Workers are not daemons, one left running blocks interpreter exit
+            self.finalizer = weakref.finalize(self, closeWorkers, self.pool)
+            self.finalizer.atexit = False
+            atexit.register(self.finalizer)
+            self.fill()
+        return self
+
+    def startWorker(self):
+        # Compiled here once rather than by every worker at the same time
+        if not self.prepared:
+            fn.prepareIfscSnapshot()
+            self.prepared = True
+        return FormWorker(self.workers, self.memory_limit)
+
+    def fill(self):
+        """
+        Queues files up to `prefetch` ahead and hands them to idle workers
+        """
+        in_flight = len(self.queue) + sum(worker.task is not None for worker in self.pool)
+        while self.files_left and (self.prefetch is None or in_flight + len(self.results) < self.prefetch):
+            file = next(self.files, None)
+            if file is None:
+                self.files_left = False
+                break
+            if self.journal is not None and self.resume(self.next_index, file):
+                self.next_index += 1
+                continue
+            self.queue.append((self.next_index, file))
+            self.next_index += 1
+            in_flight += 1
+
+        while self.queue and len(self.pool) < self.workers:
+            self.pool.append(self.startWorker())
+        for worker in self.pool:
+            if worker.task is None and self.queue:
+                worker.submit(self.queue.popleft())
+
+    def resume(self, index, file):
+        """
+        Notes the hash of the form for the journal, and hands out its result
+        if an earlier run of the session parsed it
+        Returns: True if the result came from the journal
+        """
+        try:
+            digest = formParser.FormDocument(file).getHash()
+        except OSError:
+            return False  # Let the worker report it
+        result = self.journal.getResult(digest)
+        if result is None:
+            self.hashes[index] = digest
+            return False
+        result["file"] = file
+        result["hash"] = digest
+        self.results[index] = result
+        return True
+
+    def storeResult(self, index, result):
+        # None when the file couldn't be read for hashing
+        digest = self.hashes.pop(index, None)
+        result["hash"] = digest
+        if digest is not None:
+            # Watchdog failures may pass on a retry, only keep real parses
+            if not result["error"]:
+                self.journal.record(digest, result["file"], "parsed", result=result)
+        self.results[index] = result
+
+    def add(self, file_list):
+        """
+        Queues more files behind the ones already given
+        """
+        self.files = itertools.chain(self.files, file_list)
+        self.files_left = True
+        if self.pool is not None:
+            self.fill()
+
+    def collect(self, wait_time=None):
+        """
+        Waits for any worker to finish or hit its deadline (or wait_time
+        seconds), and stores the results of finished, timed out and dead
+        workers
+        """
+        busy = [worker for worker in self.pool if worker.task is not None]
+        if not busy:
+            return
+        if self.timeout:
+            now = time.monotonic()
+            deadline = max(0, min(worker.started + self.timeout for worker in busy) - now)
+            wait_time = deadline if wait_time is None else min(wait_time, deadline)
+        wait([worker.conn for worker in busy] + [worker.process.sentinel for worker in busy], wait_time)
+
+        for i, worker in enumerate(self.pool):
+            if worker.task is None:
+                continue
+            index, file = worker.task
+
+            if worker.conn.poll():
+                try:
+                    index, result = worker.conn.recv()
+                except (EOFError, OSError):
+                    result = getFailedResult(file, "Worker stopped while parsing")
+                    self.pool[i] = self.replaceWorker(worker)
+                else:
+                    worker.task = None
+                self.storeResult(index, result)
+
+            elif not worker.process.is_alive():
+                reason = f"Worker stopped while parsing (exit code {worker.process.exitcode})"
+                self.storeResult(index, getFailedResult(file, reason))
+                self.pool[i] = self.replaceWorker(worker)
+
+            elif self.timeout and time.monotonic() - worker.started > self.timeout:
+                reason = f"Parsing took longer than {self.timeout}s"
+                self.storeResult(index, getFailedResult(file, reason))
+                self.pool[i] = self.replaceWorker(worker)
+
+    def replaceWorker(self, worker):
+        worker.kill()
+        return self.startWorker()
+
+    def __iter__(self):
+        self.start()
+        index = 0
+        while True:
+            while index not in self.results:
+                self.fill()
+                if index == self.next_index and not self.files_left:
+                    return
+                self.collect()
+            result = self.results.pop(index)
+            index += 1
+            self.fill()
+            yield result
+
+    def getFinished(self, wait_time):
+        """
+        Waits up to wait_time seconds for forms to finish
+        Returns: Results of every form finished so far, in file_list order,
+                 without waiting for the forms before them
+        """
+        self.start()
+        self.fill()
+        if any(worker.task is not None for worker in self.pool):
+            self.collect(wait_time)
+        else:
+            time.sleep(wait_time)
+        finished = [self.results.pop(index) for index in sorted(self.results)]
+        self.fill()
+        return finished
+
+    def close(self):
+        if self.pool is not None:
+            atexit.unregister(self.finalizer)
+            self.finalizer()
+            self.pool = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FormWorker:
+    """
+    One worker process parsing a form at a time, task = (index, file)
+    """
+
+    def __init__(self, workers, memory_limit):
+        self.conn, worker_conn = multiprocessing.Pipe()
+        # Not a daemon, daemons can't start the page parallel PDF pool
+        self.process = multiprocessing.Process(
+            target=runWorker, args=(worker_conn, workers, memory_limit)
+        )
+        self.process.start()
+        worker_conn.close()
+        self.task = None
+        self.started = None
+
+    def submit(self, task):
+        self.task = task
+        self.started = time.monotonic()
+        try:
+            self.conn.send(task)
+        except OSError:
+            # Worker already gone, collect() reports and replaces it
+            pass
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+# ========================= [ @PIPELINE_FUNCTIONS ] ========================= #
+
+
+def closeWorkers(pool):
+    """
+    Stops every worker of a pipeline's pool (on close(), garbage collection
+    or interpreter exit, whichever comes first)
+    """
+    for worker in pool:
+        worker.kill()
+    pool.clear()
+
+
+def runWorker(conn, workers, memory_limit):
+    """
+    Worker process loop: parses each (index, file) received on conn and
+    sends back (index, result) until the pipeline closes
+    """
+    initWorker(workers, memory_limit)
+    while True:
+        try:
+            index, file = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        try:
+            result = parseForm(file)
+        except MemoryError:
+            result = getFailedResult(file, f"Parsing needed more than {memory_limit} MB")
+        except Exception as e:
+            result = getFailedResult(file, f"{type(e).__name__}: {e}")
+        conn.send((index, result))
+
+
+def initWorker(workers, memory_limit=None):
+    """
+    Runs once per worker process: loads the IFSC dataset for every form the
+    worker parses, ignores Ctrl+C, which the operator process handles, and
+    shares the cores left over by the pipeline for page parallel PDF tables.
+    memory_limit (MB) caps what parsing may allocate on top of the dataset.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    formParser.page_workers = max(1, (os.cpu_count() or 1) // workers)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        fn.updateIfscInVar()
+
+    if memory_limit and resource is not None:
+        limit = getAddressSpace() + memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def getAddressSpace():
+    """
+    Returns: Virtual memory size of this process in bytes (0 if unknown)
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError):
+        return 0
+
+
+def getFailedResult(file, reason):
+    """
+    Returns: parseForm() result for a form the watchdog gave up on
+    """
+    return {
+        "file": file,
+        "correct": False,
+        "institution": {},
+        "student_data": {},
+        "district_guess": "Unknown",
+        "ifsc_valid": [],
+        "ifsc_districts": [],
+        "content_hash": None,
+        "log": "",
+        "error": reason,
+    }
+
+
+def parseForm(file):
+    """
+    Parameter: Supported File
+    Returns: Dictionary of everything processForms needs before verification
+
+    data = {
+        "file": file,
+        "correct": True / False (from correctFormat()),
+        "institution": getInstitutionDetails() or {},
+        "student_data": cleaned and normalized getStudentDetails() or {},
+        "district_guess": guessDistrictFromIfscList() or "Unknown",
+        "ifsc_valid": [True / False, ...] one per student,
+        "ifsc_districts": [district, ...] one per student,
+        "content_hash": formIndex.getContentHash() of student_data or None,
+        "log": Messages printed while parsing, to be shown with the form,
+        "error": None, or why the form was rejected early / the watchdog gave up,
+    }
+    """
+    data = {
+        "file": file,
+        "correct": False,
+        "institution": {},
+        "student_data": {},
+        "district_guess": "Unknown",
+        "ifsc_valid": [],
+        "ifsc_districts": [],
+        "content_hash": None,
+        "error": None,
+    }
+
+    log = io.StringIO()
+    form = fn.openForm(file)
+    try:
+        with contextlib.redirect_stdout(log):
+            # Obvious non-forms are turned away before the slow extraction
+            data["error"] = fn.getRejection(form)
+            if data["error"] is None and fn.correctFormat(form):
+                student_data = fn.getStudentDetails(form)
+                # Cleaning up Student Data for processing
+                student_data = fn.cleanStudentData(student_data)
+                # Normalizing Student Data
+                student_data = fn.normalizeStudentData(student_data)
+                # Guessing District
+                ifsc_list = fn.getStudentIfscList(student_data)
+                ifsc_details = fn.getIfscDetailsList(ifsc_list, fn.var["ifsc_dataset"])
+
+                data["correct"] = True
+                data["institution"] = fn.getInstitutionDetails(form)
+                data["student_data"] = student_data
+                data["district_guess"] = fn.guessDistrictFromIfscList(ifsc_list)
+                data["ifsc_valid"] = ifsc_details["valid"]
+                data["ifsc_districts"] = ifsc_details["district"]
+                data["content_hash"] = formIndex.getContentHash(student_data)
+    finally:
+        # Workers live on, don't leave the document open after an error
+        form.close()
+
+    data["log"] = log.getvalue()
+    return data
@@ -0,0 +1,206 @@
+import os           # File states
+import time         # Settling new files
+import queue        # File system events
+import csv          # Review queue
+import sqlite3      # SQLite DB operations
+import formPipeline     # Background form parsing
+import processFormsBatch    # Sorting parsed forms
+import formIndex    # Duplicate forms
+import function as fn
+from function import var
+
+try:
+    # inotify (Linux) / FSEvents / ReadDirectoryChangesW, polling without it
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+# Seconds between checks for new forms and finished parses
+POLL_INTERVAL = 1
+# Seconds a form has to stay unchanged before parsing (still being copied)
+SETTLE_TIME = 2
+# Forms looked for in the watched directory
+EXTENSIONS = (".docx", ".pdf")
+
+
+# ============================ [ @WATCH_CLASSES ] ============================ #
+
+
+class FolderWatcher:
+    """
+    Finds forms landing in a directory, from file system events when the
+    watchdog package is installed, else by rescanning it every poll.
+
+    getNewFiles() hands out each form once it stopped changing for
+    SETTLE_TIME seconds, and again only if it is changed later (eg: the
+    operator fixed it in place).
+    """
+
+    def __init__(self, dir):
+        self.dir = dir
+        self.events = queue.SimpleQueue()
+        self.observer = None
+        self.rescan = True
+        self.pending = {}   # {file: (size, mtime) when last checked}
+        self.seen = {}      # {file: (size, mtime) when handed out}
+
+    def start(self):
+        if Observer is not None:
+            self.observer = Observer()
+            self.observer.schedule(FormEventHandler(self.events), str(self.dir), recursive=False)
+            self.observer.start()
+        return self
+
+    def getNewFiles(self):
+        """
+        Returns: List of forms ready to be parsed
+        """
+        # Forms already there when watching started are only found by a scan
+        if self.observer is None or self.rescan:
+            self.rescan = False
+            candidates = list(fn.scanFiles(self.dir, list(EXTENSIONS)))
+        else:
+            candidates = []
+            while not self.events.empty():
+                candidates.append(self.events.get())
+
+        for file in candidates:
+            name = os.path.basename(file)
+            if name.endswith(EXTENSIONS) and not name.startswith("."):
+                self.pending.setdefault(file, None)
+
+        ready = []
+        now = time.time()
+        for file, last_state in list(self.pending.items()):
+            state = getFileState(file)
+            if state is None or state == self.seen.get(file):
+                del self.pending[file]
+            elif state == last_state and now - state[1] >= SETTLE_TIME:
+                del self.pending[file]
+                self.seen[file] = state
+                ready.append(file)
+            else:
+                self.pending[file] = state
+        return ready
+
+    def markSeen(self, file):
+        """
+        Keeps a form renamed by the caller (eg: sanitizeFilename) from
+        turning up again under its new name
+        """
+        self.seen[str(file)] = getFileState(file)
+
+    def close(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+
+class FormEventHandler(FileSystemEventHandler):
+    """
+    Queues the path of every file created, changed or moved in
+    """
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        file = getattr(event, "dest_path", "") or event.src_path
+        self.events.put(file)
+
+
+# =========================== [ @WATCH_FUNCTIONS ] =========================== #
+
+
+def getFileState(file):
+    """
+    Returns: (size, mtime) of file, None if it is gone
+    """
+    try:
+        stat = os.stat(file)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime
+
+
+def main():
+    """
+    Watches the input directory until interrupted: forms are parsed and
+    checked against var["batch_rules"] seconds after they land, by workers
+    that keep the IFSC dataset loaded, and their results are appended to
+    "review queue.csv". Forms passing the rules are also sorted into their
+    district directory when var["watch_auto_accept"] is on.
+    """
+    db_file = var["db_file"]
+    input_dir = var["input_dir"]
+    rules = var["batch_rules"]
+    auto_accept = var["watch_auto_accept"]
+    formatting_dir = fn.initNestedDir(input_dir, "formatting issues")
+    duplicates_dir = fn.initNestedDir(input_dir, "duplicates")
+    report_file = os.path.join(input_dir, "review queue.csv")
+    accepted_accounts = {}
+    form_index = formIndex.FormIndex(var["form_index_path"])
+    dedup = formIndex.FormDeduplicator(form_index, duplicates_dir)
+
+    pipeline = formPipeline.FormPipeline(
+        [],
+        timeout=var["form_timeout"],
+        memory_limit=var["form_memory_limit"],
+    )
+    watcher = FolderWatcher(input_dir).start()
+
+    print("🔵 Connecting to Database")
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+    new_report = not os.path.exists(report_file)
+    report = open(report_file, mode='a', newline='', encoding='utf-8')
+    writer = csv.writer(report)
+    if new_report:
+        writer.writerow(["File", "Decision", "District", "Students", "Reasons"])
+
+    mode = "file system events" if watcher.observer else f"polling every {POLL_INTERVAL}s"
+    print(f"✅ Watching {input_dir} ({mode}, Ctrl+C to stop)")
+    try:
+        while True:
+            new_files = []
+            for file in watcher.getNewFiles():
+                file = fn.sanitizeFilename(file)
+                watcher.markSeen(file)
+                new_files.append(file)
+            # Copies of a form seen before are set aside without parsing
+            pipeline.add(list(dedup.filterFiles(new_files)))
+
+            for result in pipeline.getFinished(POLL_INTERVAL):
+                # Taken by `forms` or the operator while it was parsing
+                if not os.path.exists(result["file"]):
+                    continue
+                if dedup.checkResult(result):
+                    continue
+                row = processFormsBatch.sortResult(
+                    result, rules, cursor, accepted_accounts, input_dir, formatting_dir, auto_accept
+                )
+                if row[1] in ("Accepted", "Formatting"):
+                    dedup.register(row[0], result["content_hash"], row[1] == "Accepted")
+                writer.writerow(row)
+                report.flush()
+
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+
+    finally:
+        watcher.close()
+        pipeline.close()
+        report.close()
+        form_index.close()
+        print("🔵 Closing DB")
+        conn.close()
+        print(f"📄 {report_file}")
+
+
+if __name__ == "__main__":
+    main()
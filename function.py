@@ -6,12 +6,17 @@ from pandas import DataFrame        # Printing Tables
 from pathlib import Path            # OS Independent filepath
 from sys import exit
 import threading    # Multithreading Stuff
-import csv          # CSV file manipulation
+import datetime     # Formatting issue log time
+import re           # AcroForm field names
 import os           # Directory path support
-import docx         # Docx parsing
-import glob         # Finding files with extensions
-import pdfplumber   # PDF parsing
 import tabulate     # CLI Table Borders
+import ifscIndex    # Compiled IFSC snapshot
+import ifscDaemon   # Shared IFSC dataset process
+import stdNormalizer    # Class name normalization
+import formParser   # Single pass DOCX / PDF extraction
+import formCache    # Parse results by form content
+import contextlib   # Capturing parser logs
+import io           # Capturing parser logs
 import config as cfg
 var = cfg.initVarCommon()
 
@@ -22,9 +27,9 @@ var = cfg.initVarCommon()
 def loadIfscDataset(csv_file):
     """
     Parameter: CSV Dataset from RazorPay
-    Returns: Dataset Dictionary loaded into memory
+    Returns: Compact IfscStore loaded into memory
 
-    dataset[row['IFSC']] = {
+    dataset.get(row['IFSC']) -> {
         'Bank': row['BANK'],
         'Branch': row['BRANCH'],
         'Centre': row['CENTRE'],
@@ -34,24 +39,59 @@ def loadIfscDataset(csv_file):
         'City': row['CITY'],
     }
     """
-    dataset = {}
-    with open(csv_file, mode='r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            dataset[row['IFSC']] = {
-                'Bank': row['BANK'],
-                'Branch': row['BRANCH'],
-                'Centre': row['CENTRE'],
-                'District': row['DISTRICT'],
-                'State': row['STATE'],
-                'Address': row['ADDRESS'],
-                'City': row['CITY'],
-            }
+    dataset = ifscIndex.loadIfscStore(csv_file)
     return dataset
 
 
 def updateIfscInVar():
-    var["ifsc_dataset"] = loadIfscDataset(var["ifsc_dataset_path"])
+    # Borrow the dataset of a running IFSC Daemon if there is one
+    remote = ifscDaemon.connectIfscDaemon(var["ifsc_socket_path"], loadLocalIfscDataset)
+    if remote:
+        print("🔵 Using IFSC Daemon")
+        var["ifsc_dataset"] = remote
+        return
+
+    var["ifsc_dataset"] = loadLocalIfscDataset()
+
+
+def loadLocalIfscDataset():
+    """
+    Returns: IFSC Dataset loaded in this process, from the compiled snapshot
+    """
+    # Keep only the configured states / banks in memory, rest on a miss
+    if var["ifsc_hot_states"] or var["ifsc_hot_banks"]:
+        return ifscIndex.loadIfscPartition(
+            var["ifsc_dataset_path"],
+            var["ifsc_index_path"],
+            var["ifsc_hot_index_path"],
+            loadIfscDataset,
+            var["district_dataset"],
+            var["ifsc_hot_states"],
+            var["ifsc_hot_banks"],
+        )
+
+    return ifscIndex.loadIfscIndex(
+        var["ifsc_dataset_path"],
+        var["ifsc_index_path"],
+        loadIfscDataset,
+        var["district_dataset"],
+    )
+
+
+def prepareIfscSnapshot():
+    """
+    Compiles the IFSC snapshot now if the CSV changed, so processes started
+    afterwards (formPipeline workers) only load the finished snapshot instead
+    of all compiling it at once. Nothing to do if this process already holds
+    the dataset or an IFSC Daemon is serving it.
+    """
+    if "ifsc_dataset" in var:
+        return
+    remote = ifscDaemon.connectIfscDaemon(var["ifsc_socket_path"])
+    if remote:
+        remote.close()
+        return
+    loadLocalIfscDataset()
 
 
 def getDistrictFromUser():
@@ -215,17 +255,17 @@ def printStudentData(student_data):
 
 def printStudentDataFrame(student_data):
     ifsc_dataset = var["ifsc_dataset"]
+    ifsc_list = getStudentIfscList(student_data)
+    ifsc_valid = getIfscDetailsList(ifsc_list, ifsc_dataset)["valid"]
     student_record = []
-    for key, val in student_data.items():
-
-        ifsc = val[2]
-        branch = getBranchFromIfsc(ifsc, ifsc_dataset)
+    for (key, val), valid in zip(student_data.items(), ifsc_valid):
 
         # Check IFSC Validity
-        if branch == "":
-            ifsc = f"{ifsc}❌"
-        else:
+        ifsc = val[2]
+        if valid:
             ifsc = f"{ifsc}✅"
+        else:
+            ifsc = f"{ifsc}❌"
 
         row = [key+1, val[0], val[1], ifsc, val[3], val[4], val[5]]
         student_record.append(row)
@@ -258,6 +298,55 @@ def userVerifyStudentData(student_data):
         return False
 
 
+def getAutoAcceptIssues(result, rules, cursor, accepted_accounts):
+    """
+    Arguments: (result, rules, cursor, accepted_accounts)
+        - result: Parsed form from formPipeline.parseForm()
+        - rules: var["batch_rules"], checks a form has to pass
+        - cursor: SQLite database cursor for the duplicate account check
+        - accepted_accounts: {acc_no: file} of forms accepted earlier in the batch
+
+    Returns: List of reasons the form needs a human ([] if it can be accepted)
+    """
+    student_data = result["student_data"]
+    if not student_data:
+        return ["No students found"]
+
+    # Accepted forms are sorted by district, which has to be known
+    issues = []
+    district = result["district_guess"]
+    if district not in var["district_dataset"]:
+        issues.append(f"District not recognized: {district}")
+
+    if rules.get("valid_ifsc"):
+        ifsc_list = getStudentIfscList(student_data)
+        invalid = [ifsc for ifsc, valid in zip(ifsc_list, result["ifsc_valid"]) if not valid]
+        if invalid:
+            issues.append(f"IFSC not found: {', '.join(invalid)}")
+
+    if rules.get("known_class") and not isValidStudentStd(student_data):
+        unknown = [str(value[1]) for value in student_data.values() if type(value[1]) is not int]
+        issues.append(f"Class not recognized: {', '.join(unknown)}")
+
+    if rules.get("district_majority"):
+        count = result["ifsc_districts"].count(district)
+        total = len(result["ifsc_districts"])
+        if count * 2 <= total:
+            issues.append(f"District {district} only matches {count} of {total} students")
+
+    if rules.get("no_duplicates"):
+        acc_list = [value[3] for value in student_data.values()]
+        if len(set(acc_list)) < len(acc_list):
+            issues.append("Account repeated within the form")
+        if checkExistingAccounts(student_data, cursor):
+            issues.append("Accounts already in Database")
+        other_files = {accepted_accounts[acc_no] for acc_no in acc_list if acc_no in accepted_accounts}
+        if other_files:
+            issues.append(f"Accounts also in {', '.join(sorted(other_files))}")
+
+    return issues
+
+
 # ======================== [ @PROCESSOR_FUNCTIONS ] ======================== #
 
 
@@ -266,262 +355,15 @@ def convertStdToNum(data):
     Parameter: Student Standard / Class Number
     Returns: Numeric Value if String
     """
-    data = str(data)
-    data = data.strip().lower()
-
-    std_dataset = {
-        1: [
-            "1",
-            "1a",
-            "1b",
-            "1c",
-            "1d",
-            "1e",
-            "1 a",
-            "1 b",
-            "1 c",
-            "1 d",
-            "1 e",
-            "i",
-            "1st",
-            "one",
-            "first"
-        ],
-        2: [
-            "2",
-            "2a",
-            "2b",
-            "2c",
-            "2d",
-            "2e",
-            "2 a",
-            "2 b",
-            "2 c",
-            "2 d",
-            "2 e",
-            "ii",
-            "2nd",
-            "two",
-            "second"
-        ],
-        3: [
-            "3",
-            "3a",
-            "3b",
-            "3c",
-            "3d",
-            "3e",
-            "3 a",
-            "3 b",
-            "3 c",
-            "3 d",
-            "3 e",
-            "iii",
-            "3rd",
-            "three",
-            "third"
-        ],
-        4: [
-            "4",
-            "4a",
-            "4b",
-            "4c",
-            "4d",
-            "4e",
-            "4 a",
-            "4 b",
-            "4 c",
-            "4 d",
-            "4 e",
-            "iv",
-            "1v",
-            "4th",
-            "four",
-            "fourth"
-        ],
-        5: [
-            "5",
-            "5a",
-            "5b",
-            "5c",
-            "5d",
-            "5e",
-            "5 a",
-            "5 b",
-            "5 c",
-            "5 d",
-            "5 e",
-            "v",
-            "5th",
-            "five",
-            "fifth",
-        ],
-        6: [
-            "6",
-            "6a",
-            "6b",
-            "6c",
-            "6d",
-            "6e",
-            "6 a",
-            "6 b",
-            "6 c",
-            "6 d",
-            "6 e",
-            "vi",
-            "v1",
-            "six",
-            "6th",
-            "sixth",
-        ],
-        7: [
-            "7",
-            "7a",
-            "7b",
-            "7c",
-            "7d",
-            "7e",
-            "7 a",
-            "7 b",
-            "7 c",
-            "7 d",
-            "7 e",
-            "vii",
-            "v11",
-            "7th",
-            "seven",
-            "seventh",
-        ],
-        8: [
-            "8",
-            "8a",
-            "8b",
-            "8c",
-            "8d",
-            "8e",
-            "8 a",
-            "8 b",
-            "8 c",
-            "8 d",
-            "8 e",
-            "v111",
-            "viii",
-            "8th",
-            "eight",
-            "eighth",
-        ],
-        9: [
-            "9",
-            "9a",
-            "9b",
-            "9c",
-            "9d",
-            "9e",
-            "9 a",
-            "9 b",
-            "9 c",
-            "9 d",
-            "9 e",
-            "1x",
-            "ix",
-            "9th",
-            "nine",
-            "nineth",
-        ],
-        10: [
-            "10",
-            "10a",
-            "10b",
-            "10c",
-            "10d",
-            "10e",
-            "10 a",
-            "10 b",
-            "10 c",
-            "10 d",
-            "10 e",
-            "x",
-            "10th",
-            "ten",
-            "tenth",
-        ],
-        11: [
-            "11",
-            "x1",
-            "xi",
-            "11th",
-            "plus one",
-            "plusone",
-            "+1",
-            "+1 science",
-            "+1 commerce",
-            "+1 humanities",
-        ],
-        12: [
-            "12",
-            "x11",
-            "xii",
-            "12th",
-            "plus two",
-            "plustwo",
-            "+2",
-            "+2 science",
-            "+2 commerce",
-            "+2 humanities",
-        ],
-        13: [
-            "1 dc",
-            "1dc",
-            "i dc",
-            "idc",
-            "ist dc",
-            "1stdc",
-            "1st dc"
-        ],
-        14: [
-            "2 dc",
-            "2dc",
-            "ii dc",
-            "iidc",
-            "iind dc",
-            "2nddc",
-            "2nd dc"
-        ],
-        15: [
-            "3 dc",
-            "3dc",
-            "iii dc",
-            "iiidc",
-            "iiird dc",
-            "3rddc",
-            "3rd dc"
-        ],
-        16: [
-            "1 pg",
-            "1pg",
-            "i pg",
-            "ipg",
-            "ist pg",
-            "1st pg",
-            "1stpg"
-        ],
-        17: [
-            "2 pg",
-            "2pg",
-            "ii pg",
-            "iipg",
-            "iind pg",
-            "2ndpg",
-            "2nd pg"
-        ],
-    }
-    if isinstance(data, str):
-        data = data.lower()
-        for key, values in std_dataset.items():
-            for value in values:
-                if data == value:
-                    data = key
-    return data
+    return stdNormalizer.convertStdToNum(data)
+
+
+def convertStdListToNum(data_list):
+    """
+    Parameter: List or column of Student Standards
+    Returns: List of Numeric Values, one per Standard
+    """
+    return stdNormalizer.convertStdListToNum(data_list)
 
 
 def getBranchFromIfsc(ifsc, ifsc_dataset):
@@ -540,13 +382,94 @@ def getBranchFromIfsc(ifsc, ifsc_dataset):
         if ifsc_details:
             branch = ifsc_details["Branch"]
 
-    # Clean Up Branch
+    return cleanBranchName(branch)
+
+
+def cleanBranchName(branch):
+    """
+    Parameter: Branch name from RazorPay Dataset
+    Returns: Branch name without the "IMPS" marker
+    """
     if "IMPS" in branch:
         branch = branch.replace("IMPS", "").strip()
-
     return branch
 
 
+def getIfscDetailsList(ifsc_list, ifsc_dataset):
+    """
+    Arguments: (ifsc_list, ifsc_dataset)
+        - ifsc_list: List or column of IFSC Codes
+        - ifsc_dataset: IFSC Razorpay Dataset from loadIfscDataset()
+
+    Returns: Aligned lists, one entry per code in ifsc_list
+
+    details = {
+        "ifsc": [ifsc1, ifsc2, ...],
+        "valid": [True, False, ...],
+        "bank": [bank1, "", ...],
+        "branch": [branch1, "", ...],
+        "district": [district1, "Unknown", ...],
+    }
+    """
+    district_list = var["district_dataset"]
+
+    if hasattr(ifsc_dataset, "resolveMany"):
+        details = ifsc_dataset.resolveMany(ifsc_list, district_list)
+    else:
+        ifsc_list = list(ifsc_list)
+        details = {
+            "ifsc": ifsc_list,
+            "valid": [],
+            "bank": [],
+            "branch": [],
+            "district": [],
+        }
+        for ifsc in ifsc_list:
+            ifsc_info = ifsc_dataset.get(ifsc) if type(ifsc) is str else None
+            details["valid"].append(bool(ifsc_info))
+            details["bank"].append(ifsc_info["Bank"] if ifsc_info else "")
+            details["branch"].append(ifsc_info["Branch"] if ifsc_info else "")
+            details["district"].append(getDistrictFromIfsc(ifsc, ifsc_dataset))
+
+    details["branch"] = [cleanBranchName(branch) for branch in details["branch"]]
+    return details
+
+
+def getIfscDetailsFrame(ifsc_list, ifsc_dataset):
+    """
+    Arguments: (ifsc_list, ifsc_dataset)
+        - ifsc_list: List or pandas column of IFSC Codes
+        - ifsc_dataset: IFSC Razorpay Dataset from loadIfscDataset()
+
+    Returns: DataFrame with columns IFSC, Valid, Bank, Branch, District
+    """
+    details = getIfscDetailsList(ifsc_list, ifsc_dataset)
+    df = DataFrame({
+        "IFSC": details["ifsc"],
+        "Valid": details["valid"],
+        "Bank": details["bank"],
+        "Branch": details["branch"],
+        "District": details["district"],
+    })
+    return df
+
+
+def getIfscSuggestions(ifsc, ifsc_dataset, limit=3):
+    """
+    Arguments: (ifsc, ifsc_dataset, limit)
+        - ifsc: Invalid IFSC Code
+        - ifsc_dataset: IFSC Razorpay Dataset from loadIfscDataset()
+        - limit: Maximum number of suggestions
+
+    Returns:
+        - []: If the dataset has no suggestion index or nothing is close
+        - suggestions: Valid IFSC codes within edit distance 2 of ifsc
+    """
+    if not hasattr(ifsc_dataset, "suggest"):
+        return []
+    return ifsc_dataset.suggest(ifsc, limit=limit)
+
+
 def normalizeStudentData(student_data):
     """
     Parameter:
@@ -561,9 +484,14 @@ def normalizeStudentData(student_data):
     }
     """
     ifsc_dataset = var["ifsc_dataset"]
+
+    # Resolving every IFSC of the form in a single batch
+    ifsc_list = getStudentIfscList(student_data)
+    rbi_branch_list = getIfscDetailsList(ifsc_list, ifsc_dataset)["branch"]
+
     i = 0
     data = {}
-    for _, value in student_data.items():
+    for value, rbi_branch in zip(student_data.values(), rbi_branch_list):
         name = value[0]
         standard = value[1]
         ifsc = value[2]
@@ -578,8 +506,11 @@ def normalizeStudentData(student_data):
         # Normalizing Standard standard to Int variant
         standard = convertStdToNum(standard)
 
-        # Normalizing Branch from IFSC using RazorPay Dataset
-        rbi_branch = getBranchFromIfsc(ifsc, ifsc_dataset)
+        # Suggesting valid codes for mistyped IFSC
+        if rbi_branch == "":
+            suggestions = getIfscSuggestions(ifsc, ifsc_dataset)
+            if suggestions:
+                print(f"💡 {name}: {ifsc} not found, did you mean {', '.join(suggestions)}?")
 
         # "," fix and long branch name fix
         if rbi_branch and "," not in rbi_branch and len(rbi_branch) < 30:
@@ -607,12 +538,9 @@ def guessDistrictFromIfscList(ifsc_list):
     Parameters: (ifsc_list)
     Returns: Guessed District as a String
     """
-    district_list = []
     ifsc_dataset = var["ifsc_dataset"]
     # Create a list of Districts
-    for ifsc in ifsc_list:
-        district = getDistrictFromIfsc(ifsc, ifsc_dataset)
-        district_list.append(district)
+    district_list = getIfscDetailsList(ifsc_list, ifsc_dataset)["district"]
 
     # Finding the most occured District
     district = get_most_common_value(district_list)
@@ -640,42 +568,16 @@ def getDistrictFromIfsc(ifsc, ifsc_dataset):
     Parameters: (ifsc_code, ifsc_dataset)
     Returns: District as a String
     """
-    district = "Unknown"
-    ifsc_info = ifsc_dataset.get(ifsc)
     district_list = var["district_dataset"]
 
-    if ifsc_info:
+    # Precomputed district table of the compiled dataset
+    if hasattr(ifsc_dataset, "getDistrict"):
+        return ifsc_dataset.getDistrict(ifsc, district_list)
 
-        # District Finder (Initial Algorithm)
-        district = ifsc_info["District"]
-        # Return correct item from district data
-        for item in district_list:
-            if item.lower() == district.lower():
-                district = item
-
-        # District Finder v2.0 (New Algorithm)
-        if district not in district_list:
-            value_list = []
-            for value in ifsc_info.values():
-                value_list.append(value)
-            district = get_most_common_value(value_list)
-
-            # Return correct item from district data
-            for item in district_list:
-                if item.lower() == district.lower():
-                    district = item
-
-        # District Finder v1.0 (Fallback)
-        if district not in district_list:
-            for item in district_list:
-                address = ifsc_info["Address"]
-                if item.lower() in address.lower():
-                    district = item
-
-            # Return correct item from district data
-            for item in district_list:
-                if item.lower() == district.lower():
-                    district = item
+    district = "Unknown"
+    ifsc_info = ifsc_dataset.get(ifsc)
+    if ifsc_info:
+        district = ifscIndex.resolveDistrict(ifsc_info, district_list)
 
     return district
 
@@ -975,6 +877,10 @@ def printExistingAccountsDiff(studentData, existingAccounts):
 
     ifsc_dataset = var["ifsc_dataset"]
 
+    # Resolving every IFSC of the form in a single batch
+    details = getIfscDetailsList(getStudentIfscList(studentData), ifsc_dataset)
+    branch_by_ifsc = dict(zip(details["ifsc"], details["branch"]))
+
     comparison_list = []
     data_by_acc = {entry[3]: entry for entry in studentData.values()}
 
@@ -985,11 +891,14 @@ def printExistingAccountsDiff(studentData, existingAccounts):
             ifsc = data_by_acc[db_acc][2]
             accno = data_by_acc[db_acc][3]
 
-            branch = getBranchFromIfsc(ifsc, ifsc_dataset)
+            branch = branch_by_ifsc[ifsc]
 
             # Check IFSC Validity
             if branch == "":
                 ifsc_check = f"{ifsc} ❌"
+                suggestions = getIfscSuggestions(ifsc, ifsc_dataset, limit=1)
+                if suggestions:
+                    ifsc_check = f"{ifsc_check} 💡{suggestions[0]}"
             else:
                 ifsc_check = f"{ifsc} ✅"
 
@@ -1012,9 +921,12 @@ def printExistingAccountsDiff(studentData, existingAccounts):
     newly_added_list = []
     nonExistingAccounts = getNonExistingAccounts(studentData, existingAccounts)
     for name, standard, ifsc, acc_no, holder, branch in nonExistingAccounts:
-        branch = getBranchFromIfsc(ifsc, ifsc_dataset)
+        branch = branch_by_ifsc[ifsc]
         if branch == "":
+            suggestions = getIfscSuggestions(ifsc, ifsc_dataset, limit=1)
             ifsc = f"{ifsc} ❌"
+            if suggestions:
+                ifsc = f"{ifsc} 💡{suggestions[0]}"
         else:
             ifsc = f"{ifsc} ✅"
         newly_added_list.append((name, standard, ifsc, acc_no, holder, branch))
@@ -1030,9 +942,47 @@ def printExistingAccountsDiff(studentData, existingAccounts):
 # ========================== [ @PARSER_FUNCTIONS ] ========================== #
 
 
+def openForm(file):
+    """
+    Parameter: Supported File or FormDocument
+    Returns: FormDocument, so a form passed around is only read once
+    """
+    if isinstance(file, formParser.FormDocument):
+        return file
+    return formParser.FormDocument(file)
+
+
+def getCachedResult(form, key, parser):
+    """
+    Arguments: (form, key, parser)
+        - form: FormDocument from openForm()
+        - key: Name of the result in the form cache (eg: "students")
+        - parser: Function returning the result for form
+
+    Returns: parser(form), taken from the form cache if a file with the same
+    content was parsed before. Messages the parser printed are replayed.
+    """
+    if "form_cache" not in var:
+        var["form_cache"] = formCache.FormCache(var["form_cache_path"])
+    cache = var["form_cache"]
+
+    digest = form.getHash()
+    found, result = cache.get(digest, key)
+    if not found:
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            data = parser(form)
+        result = data, log.getvalue()
+        cache.put(digest, key, result)
+
+    data, log = result
+    print(log, end="")
+    return data
+
+
 def getInstitutionDetails(file):
     """
-    Parameters: Supported File
+    Parameters: Supported File or FormDocument from openForm()
     Returns: Dictionary of Institution Details
 
     data = {
@@ -1042,23 +992,21 @@ def getInstitutionDetails(file):
         "email": email_id
     }
     """
-    _, file_extension = os.path.basename(file).split(".")
+    form = openForm(file)
     data = {}
 
-    if file_extension == "docx":
-        docx_file = file
-        data = getInstitutionDetailsDocx(docx_file)
+    if form.extension == "docx":
+        data = getCachedResult(form, "institution", getInstitutionDetailsDocx)
 
-    if file_extension == "pdf":
-        pdf_file = file
-        data = getInstitutionDetailsPdf(pdf_file)
+    if form.extension == "pdf":
+        data = getCachedResult(form, "institution", getInstitutionDetailsPdf)
 
     return data
 
 
 def getStudentDetails(file):
     """
-    Parameter: Supported File
+    Parameter: Supported File or FormDocument from openForm()
     Returns: A dictionary of tuples with Student details
 
     data = {
@@ -1067,23 +1015,21 @@ def getStudentDetails(file):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    _, file_extension = os.path.basename(file).split(".")
+    form = openForm(file)
     data = {}
 
-    if file_extension == "docx":
-        docx_file = file
-        data = getStudentDetailsDocx(docx_file)
+    if form.extension == "docx":
+        data = getCachedResult(form, "students", getStudentDetailsDocx)
 
-    if file_extension == "pdf":
-        pdf_file = file
-        data = getStudentDetailsPdf(pdf_file)
+    if form.extension == "pdf":
+        data = getCachedResult(form, "students", getStudentDetailsPdf)
 
     return data
 
 
-def getInstitutionDetailsDocx(docx_file):
+def getInstitutionDetailsDocx(form):
     """
-    Parameters: Document.docx file
+    Parameters: FormDocument of a .docx file
     Returns: Dictionary of Institution Details
 
     data = {
@@ -1094,15 +1040,19 @@ def getInstitutionDetailsDocx(docx_file):
     }
     """
 
-    doc = docx.Document(docx_file)
+    # Generated forms carry their data, no need to read the document
+    payload = form.loadPayload()
+    if payload:
+        return dict(payload["institution"])
+
+    paragraphs = form.load().paragraphs
     inside_institution_details = False
     name_of_institution = ""
     place = ""
     phone_number = ""
     email_id = ""
 
-    for paragraph in doc.paragraphs:
-        text = paragraph.text
+    for text in paragraphs:
         # Check if paragraph contains the "Institution Details"
         if text.startswith("Institution Details"):
             inside_institution_details = True
@@ -1133,9 +1083,9 @@ def getInstitutionDetailsDocx(docx_file):
     return data
 
 
-def getStudentDetailsDocx(docx_file):
+def getStudentDetailsDocx(form):
     """
-    Parameter: Document.docx file
+    Parameter: FormDocument of a .docx file
     Returns: A dictionary of tuples with Student details
 
     data = {
@@ -1145,20 +1095,25 @@ def getStudentDetailsDocx(docx_file):
     }
     """
 
-    doc = docx.Document(docx_file)
+    # Generated forms carry their data, no need to read the document
+    payload = form.loadPayload()
+    if payload:
+        return dict(enumerate(payload["students"]))
+
+    tables = form.load().tables
     data = {}
     i = 0
     # Iterate through the tables in the document
-    for table in doc.tables:
-        for row in table.rows:
-            first_column = row.cells[0].text
+    for table in tables:
+        for cells in table:
+            first_column = cells[0]
             if first_column != "" and first_column != "STUDENT NAME":
-                name = row.cells[0].text
-                standard = row.cells[1].text
-                ifsc = row.cells[2].text
-                acc_no = row.cells[3].text
-                holder = row.cells[4].text
-                branch = row.cells[5].text
+                name = cells[0]
+                standard = cells[1]
+                ifsc = cells[2]
+                acc_no = cells[3]
+                holder = cells[4]
+                branch = cells[5]
 
                 # Extracted data
                 data[i] = name, standard, ifsc, acc_no, holder, branch
@@ -1166,9 +1121,9 @@ def getStudentDetailsDocx(docx_file):
     return data
 
 
-def getStudentDetailsPdf(pdf_file):
+def getStudentDetailsPdf(form):
     """
-    Parameter: PDF File
+    Parameter: FormDocument of a .pdf file
     Returns: A dictionary of tuples with Student details
 
     data = {
@@ -1177,33 +1132,35 @@ def getStudentDetailsPdf(pdf_file):
         2: (name, standard, ifsc, acc_no, holder, branch)
     }
     """
-    with pdfplumber.open(pdf_file) as pdf:
-        data = {}
-        i = -1
-        for page in pdf.pages:
-            # Generate CSV list from PDF table
-            table = page.extract_table()
-            if table:
-                for row in table:
-                    # Replace \n substring with space
-                    cleaned_row = []
-                    for cell in row:
-                        if isinstance(cell, str):
-                            cleaned_row.append(cell.replace('\n', ' '))
-                        else:
-                            cleaned_row.append(cell)
-
-                    name = cleaned_row[0]
-                    standard = cleaned_row[1]
-                    ifsc = cleaned_row[2]
-                    acc_no = cleaned_row[3]
-                    holder = cleaned_row[4]
-                    branch = cleaned_row[5]
-
-                    # Extracted data
-                    if name:  # For avoiding empty rows
-                        data[i] = name, standard, ifsc, acc_no, holder, branch
-                        i = i + 1
+    # Fillable PDFs are read from their fields, not their tables
+    if form.loadFields():
+        return getStudentDetailsAcroForm(form)
+
+    data = {}
+    i = -1
+    for _, table in form.load().pages:
+        # CSV list extracted from PDF table
+        if table:
+            for row in table:
+                # Replace \n substring with space
+                cleaned_row = []
+                for cell in row:
+                    if isinstance(cell, str):
+                        cleaned_row.append(cell.replace('\n', ' '))
+                    else:
+                        cleaned_row.append(cell)
+
+                name = cleaned_row[0]
+                standard = cleaned_row[1]
+                ifsc = cleaned_row[2]
+                acc_no = cleaned_row[3]
+                holder = cleaned_row[4]
+                branch = cleaned_row[5]
+
+                # Extracted data
+                if name:  # For avoiding empty rows
+                    data[i] = name, standard, ifsc, acc_no, holder, branch
+                    i = i + 1
 
     # Removes unwanted Header data
     data.pop(-1)
@@ -1211,9 +1168,9 @@ def getStudentDetailsPdf(pdf_file):
     return data
 
 
-def getInstitutionDetailsPdf(pdf_file):
+def getInstitutionDetailsPdf(form):
     """
-    Parameters: Document.pdf file
+    Parameters: FormDocument of a .pdf file
     Returns: Dictionary of Institution Details
 
     data = {
@@ -1223,20 +1180,22 @@ def getInstitutionDetailsPdf(pdf_file):
         "email": email_id
     }
     """
+    # Fillable PDFs are read from their fields, not their text
+    if form.loadFields():
+        return getInstitutionDetailsAcroForm(form)
+
     institution_details = ""
     name_of_institution = ""
     place = ""
     phone_number = ""
     email_id = ""
 
-    with pdfplumber.open(pdf_file) as pdf:
-        for page in pdf.pages:
-            # Extract PDF as text
-            text = page.extract_text()
-            if "Institution Details" in text:
-                start = text.index("Name of the Institution")
-                end = text.index("Student Details")
-                institution_details = text[start:end]
+    for text, _ in form.load().pages:
+        # PDF page extracted as text
+        if "Institution Details" in text:
+            start = text.index("Name of the Institution")
+            end = text.index("Student Details")
+            institution_details = text[start:end]
 
     # Splitting text at '\n' into a list
     lines = institution_details.split('\n')
@@ -1267,6 +1226,96 @@ def getInstitutionDetailsPdf(pdf_file):
     return data
 
 
+def getAcroFormFieldKey(field_name, field_keys):
+    """
+    Arguments: (field_name, field_keys)
+        - field_name: AcroForm field name (eg: "Row 3.IFSC Code", "acc_no_3")
+        - field_keys: [(key, [word, ...]), ...] checked in order
+
+    Returns: (key, row)
+        - key: First key with a word in the field name, None if none match
+        - row: Last number in the field name, None if it has no number
+
+    Case, spaces and punctuation are ignored, so "Account Holder 2",
+    "accHolder[2]" and "Row2.ACCOUNT_HOLDER" all give ("holder", 2).
+    """
+    name = field_name.lower()
+    numbers = re.findall(r"\d+", name)
+    row = int(numbers[-1]) if numbers else None
+    letters = re.sub(r"[^a-z]", "", name)
+
+    for key, words in field_keys:
+        if any(word in letters for word in words):
+            return key, row
+    return None, row
+
+
+def getInstitutionDetailsAcroForm(form):
+    """
+    Parameters: FormDocument of a fillable .pdf file
+    Returns: Dictionary of Institution Details, like getInstitutionDetailsPdf()
+    """
+    # Checked in order, "Name of the Institution" only after the others
+    field_keys = [
+        ("email", ["email"]),
+        ("number", ["phone", "mobile", "contact"]),
+        ("place", ["place", "location"]),
+        ("name", ["institution", "school", "college"]),
+    ]
+    data = {
+        "name": "",
+        "place": "",
+        "number": "",
+        "email": "",
+    }
+    for field_name, value in form.loadFields().items():
+        key, row = getAcroFormFieldKey(field_name, field_keys)
+        if key and row is None and value.strip():
+            data[key] = value.strip()
+    return data
+
+
+def getStudentDetailsAcroForm(form):
+    """
+    Parameter: FormDocument of a fillable .pdf file
+    Returns: A dictionary of tuples with Student details, like getStudentDetailsPdf()
+
+    Student fields are numbered by row (eg: "Name 1", "IFSC 1", "Name 2"),
+    rows without a student name are skipped.
+    """
+    # Checked in order: "Account Holder" before "Account", "Branch Name" before "Name"
+    field_keys = [
+        ("holder", ["holder"]),
+        ("acc_no", ["accountno", "accountnumber", "accno", "account"]),
+        ("ifsc", ["ifsc"]),
+        ("branch", ["branch"]),
+        ("standard", ["class", "std", "standard", "grade"]),
+        ("name", ["name"]),
+    ]
+    rows = {}
+    for field_name, value in form.loadFields().items():
+        key, row = getAcroFormFieldKey(field_name, field_keys)
+        if key and row is not None:
+            rows.setdefault(row, {})[key] = value.replace('\n', ' ')
+
+    data = {}
+    i = 0
+    for row in sorted(rows):
+        fields = rows[row]
+        name = fields.get("name", "")
+        standard = fields.get("standard", "")
+        ifsc = fields.get("ifsc", "")
+        acc_no = fields.get("acc_no", "")
+        holder = fields.get("holder", "")
+        branch = fields.get("branch", "")
+
+        # Extracted data
+        if name.strip():  # For avoiding empty rows
+            data[i] = name, standard, ifsc, acc_no, holder, branch
+            i = i + 1
+    return data
+
+
 # ======================== [ @VALIDATION_FUNCTIONS ] ======================== #
 
 
@@ -1286,30 +1335,40 @@ def isValidStudentStd(student_data):
     return all(data)
 
 
+def getRejection(file):
+    """
+    Parameter: Supported File or FormDocument from openForm()
+    Returns: Why the file can't be a form (None if it may be one), from the
+             form cache when the same content was checked before, so cached
+             forms are not opened at all
+    """
+    form = openForm(file)
+    return getCachedResult(form, "rejection", formParser.FormDocument.getRejection)
+
+
 def correctFormat(file):
     """
+    Parameter: Supported File or FormDocument from openForm()
     Returns True if file is in correct Format
     """
     data = False
-    try:
-        _, file_extension = os.path.basename(file).split(".")
+    form = openForm(file)
 
-        if file_extension == "docx":
-            docx_file = file
-            data = correctDocxFormat(docx_file)
+    if form.extension is None:
+        print("⚠️ ValueError: Possible dot in file name")
 
-        if file_extension == "pdf":
-            pdf_file = file
-            data = correctPdfFormat(pdf_file)
+    if form.extension == "docx":
+        data = getCachedResult(form, "format", correctDocxFormat)
 
-    except ValueError:
-        print("⚠️ ValueError: Possible dot in file name")
+    if form.extension == "pdf":
+        data = getCachedResult(form, "format", correctPdfFormat)
 
     return data
 
 
-def correctPdfFormat(pdf_file):
+def correctPdfFormat(form):
     """
+    Parameter: FormDocument of a .pdf file
     Returns True if PDF is in correct Format
     """
     flags = {
@@ -1318,34 +1377,34 @@ def correctPdfFormat(pdf_file):
         "Student Heading": False,
         "Student Table": False
     }
+    if form.loadFields():
+        return correctAcroFormFormat(form)
+
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
+        for text, table in form.load().pages:
 
-                # ====== TEXT PARAGRAPH STARTS ====== #
-                text = page.extract_text()
+            # ====== TEXT PARAGRAPH STARTS ====== #
 
-                # Check Heading: Institution Details
-                if "Institution Details" in text:
-                    flags["Institution Heading"] = True
+            # Check Heading: Institution Details
+            if "Institution Details" in text:
+                flags["Institution Heading"] = True
 
-                    # Check Length: Institution Details
-                    start = text.index("Name of the Institution")
-                    end = text.index("Student Details")
-                    institution_details = text[start:end].splitlines()
-                    if len(institution_details) == 4:
-                        flags["Institution Lines"] = True
+                # Check Length: Institution Details
+                start = text.index("Name of the Institution")
+                end = text.index("Student Details")
+                institution_details = text[start:end].splitlines()
+                if len(institution_details) == 4:
+                    flags["Institution Lines"] = True
 
-                # Check Heading: Student Details
-                if "Student Details" in text:
-                    flags["Student Heading"] = True
+            # Check Heading: Student Details
+            if "Student Details" in text:
+                flags["Student Heading"] = True
 
-                # =========== TABLE STARTS =========== #
-                table = page.extract_table()
+            # =========== TABLE STARTS =========== #
 
-                # Check Content: Student Table
-                if table:
-                    flags["Student Table"] = True
+            # Check Content: Student Table
+            if table:
+                flags["Student Table"] = True
     except ValueError:
         pass
 
@@ -1363,10 +1422,38 @@ def correctPdfFormat(pdf_file):
     return status
 
 
-def correctDocxFormat(docx_file):
+def correctAcroFormFormat(form):
     """
+    Parameter: FormDocument of a fillable .pdf file
+    Returns True if its fields hold institution details and students
+    """
+    institution = getInstitutionDetailsAcroForm(form)
+    flags = {
+        "Name of the Institution": institution["name"] != "",
+        "Place": institution["place"] != "",
+        "Phone number": institution["number"] != "",
+        "Email Id": institution["email"] != "",
+        "Student Fields": len(getStudentDetailsAcroForm(form)) > 0,
+    }
+
+    # Logs
+    for key, flag in flags.items():
+        if flag is False:
+            print(f"Field not filled: {key}")
+
+    status = all(flags.values())
+    return status
+
+
+def correctDocxFormat(form):
+    """
+    Parameter: FormDocument of a .docx file
     Returns True if DOCX is in correct Format
     """
+    # Generated forms are in format as long as their data is intact
+    if form.loadPayload():
+        return True
+
     inside_institution_details = False
     flags = {
         "name": False,
@@ -1374,9 +1461,7 @@ def correctDocxFormat(docx_file):
         "number": False,
         "email": False,
     }
-    doc = docx.Document(docx_file)
-    for paragraph in doc.paragraphs:
-        text = paragraph.text
+    for text in form.load().paragraphs:
         if text.startswith("Institution Details"):
             inside_institution_details = True
         elif inside_institution_details:
@@ -1456,27 +1541,95 @@ def printFileNameHeader(file):
         printTextBox_Centered(f"📄 {file}")
 
 
-def getFileList(dir, extensions):
+def scanFiles(dir, extensions, recursive=False, skip_dirs=(),
+              min_size=None, max_size=None, modified_after=None, modified_before=None):
     """
-    Parameters: (dir, extensions)
+    Parameters: (dir, extensions, recursive, skip_dirs, min_size, max_size,
+                 modified_after, modified_before)
+        - dir: Directory Path
+        - extensions: File extension or List of File extensions
+        - recursive: Also look inside sub directories (eg: district directories)
+        - skip_dirs: Names of sub directories not to look inside
+        - min_size, max_size: File size limits in bytes
+        - modified_after, modified_before: Modification time limits
+          (datetime or timestamp)
+    Yields: File paths, sorted by name within each directory, files first
+            and then the files of each sub directory
+
+    Every directory is read with a single os.scandir() as the walk gets to
+    it, so the first files are handed out before the rest of the tree is
+    listed. Hidden files and directories (".name") are skipped like glob
+    does, unreadable ones are skipped with a warning.
+    """
+    if not isinstance(extensions, (list, tuple)):
+        extensions = [extensions]
+    extensions = tuple(extensions)
+    if isinstance(modified_after, datetime.datetime):
+        modified_after = modified_after.timestamp()
+    if isinstance(modified_before, datetime.datetime):
+        modified_before = modified_before.timestamp()
+    check_stat = any(limit is not None for limit in (min_size, max_size, modified_after, modified_before))
+
+    try:
+        with os.scandir(dir) as entries:
+            # Listed before yielding, files may get renamed while in use
+            entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError as e:
+        print(f"⚠️ Skipping unreadable directory: {e}")
+        return
+
+    sub_dirs = []
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            if entry.is_dir():
+                if recursive and entry.name not in skip_dirs:
+                    sub_dirs.append(entry.path)
+                continue
+            if not entry.name.endswith(extensions) or not entry.is_file():
+                continue
+            if check_stat:
+                stat = entry.stat()
+                if min_size is not None and stat.st_size < min_size:
+                    continue
+                if max_size is not None and stat.st_size > max_size:
+                    continue
+                if modified_after is not None and stat.st_mtime < modified_after:
+                    continue
+                if modified_before is not None and stat.st_mtime > modified_before:
+                    continue
+        except OSError:
+            continue  # Removed or unreadable since listing
+        yield entry.path
+
+    for sub_dir in sub_dirs:
+        yield from scanFiles(sub_dir, extensions, recursive, skip_dirs,
+                             min_size, max_size, modified_after, modified_before)
+
+
+def getFileList(dir, extensions, **filters):
+    """
+    Parameters: (dir, extensions, **filters)
         - dir: Directory Path
         - extensions: List of File extensions
+        - filters: recursive, skip_dirs, size and time limits of scanFiles()
     Returns: A list of file path.
 
-    file_list = [file1.ext1, file2.ext1, file3.ext2, file4.ext2]
+    file_list = [file1.ext1, file2.ext2, file3.ext1, file4.ext2]
     """
+    return list(scanFiles(dir, extensions, **filters))
 
-    file_list = []
 
-    if not isinstance(extensions, list):
-        ext = [extensions]
-
-    for ext in extensions:
-        supported_files = glob.glob(os.path.join(dir, f"*{ext}"))
-        for file in supported_files:
-            file_list = file_list + [file]
-
-    return file_list
+def logFormattingIssue(formatting_dir, file, reason):
+    """
+    Arguments: (formatting_dir, file, reason)
+    Appends why file was sent to formatting_dir to its reasons.log
+    """
+    timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+    log_file = os.path.join(formatting_dir, "reasons.log")
+    with open(log_file, mode='a', encoding='utf-8') as log:
+        log.write(f"{timestamp}\t{os.path.basename(file)}\t{reason}\n")
 
 
 def initNestedDir(input_dir, nest_name):
@@ -0,0 +1,267 @@
+import socketserver     # Unix socket server
+import socket           # Unix socket client
+import json             # Line based request / response protocol
+import time             # Dataset freshness checks
+import os               # Socket file handling
+import ifscIndex        # Compiled IFSC snapshot
+import config as cfg
+
+# Seconds between checks of the CSV for a new release
+REFRESH_INTERVAL = 5
+# Seconds a client waits for the daemon before falling back
+CLIENT_TIMEOUT = 2
+
+
+# ============================ [ @SERVER_CLASSES ] ============================ #
+
+
+class IfscRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answers newline separated JSON requests with JSON responses:
+
+    {"op": "ping"}                                  -> {"ok": true}
+    {"op": "get", "ifsc": code}                     -> {"record": {...} / null}
+    {"op": "resolve", "ifsc": [...], "districts": [...]} -> resolveMany() lists
+    {"op": "suggest", "ifsc": code, "limit": n}     -> {"suggestions": [...]}
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                response = self.server.answer(request)
+            except Exception as e:
+                response = {"error": str(e)}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class IfscDaemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Long-lived process holding the compiled IFSC dataset in memory
+    """
+    daemon_threads = True
+
+    def __init__(self, socket_path, csv_file, loadDataset):
+        self.csv_file = csv_file
+        self.loadDataset = loadDataset
+        self.signature = ifscIndex.getCsvSignature(csv_file, with_hash=False)
+        self.dataset = loadDataset()
+        self.checked_at = time.monotonic()
+        super().__init__(str(socket_path), IfscRequestHandler)
+
+    def refresh(self):
+        """
+        Reloads the dataset if the CSV changed since it was last checked
+        """
+        if time.monotonic() - self.checked_at < REFRESH_INTERVAL:
+            return
+        self.checked_at = time.monotonic()
+        signature = ifscIndex.getCsvSignature(self.csv_file, with_hash=False)
+        if signature != self.signature:
+            print("ℹ️ IFSC Dataset changed, reloading")
+            self.signature = signature
+            self.dataset = self.loadDataset()
+
+    def answer(self, request):
+        self.refresh()
+        return answerRequest(self.dataset, request)
+
+
+# ============================ [ @CLIENT_CLASSES ] ============================ #
+
+
+class RemoteIfscStore:
+    """
+    Client side stand-in for IfscStore, answering from a running IfscDaemon.
+    Supports the dataset interface used by function.py: get(), resolveMany(),
+    getDistrict() and suggest(). Records are cached per session.
+
+    If the daemon goes away mid-session, request() reconnects once and, if
+    that fails too, loads the dataset in process with loadFallback() and
+    answers from it for the rest of the session.
+    """
+
+    def __init__(self, sock, socket_path=None, loadFallback=None):
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        self.socket_path = socket_path
+        self.loadFallback = loadFallback
+        self.dataset = None
+        self.cache = {}
+
+    def send(self, payload):
+        self.sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        response = json.loads(self.reader.readline())
+        if "error" in response:
+            raise RuntimeError(f"IFSC Daemon: {response['error']}")
+        return response
+
+    def request(self, payload):
+        if self.dataset is None:
+            try:
+                return self.send(payload)
+            except (OSError, ValueError):
+                pass  # Daemon stopped or restarted
+            self.close()
+            sock = openDaemonSocket(self.socket_path) if self.socket_path else None
+            if sock is not None:
+                print("🔁 Reconnected to IFSC Daemon")
+                self.sock = sock
+                self.reader = sock.makefile("rb")
+                try:
+                    return self.send(payload)
+                except (OSError, ValueError):
+                    self.close()
+            if self.loadFallback is None:
+                raise RuntimeError("IFSC Daemon stopped answering")
+            print("⚠️ IFSC Daemon gone, loading IFSC Dataset in process")
+            self.dataset = self.loadFallback()
+
+        response = answerRequest(self.dataset, payload)
+        if "error" in response:
+            raise RuntimeError(f"IFSC Dataset: {response['error']}")
+        return response
+
+    def get(self, ifsc, default=None):
+        if ifsc not in self.cache:
+            self.cache[ifsc] = self.request({"op": "get", "ifsc": ifsc})["record"]
+        record = self.cache[ifsc]
+        return default if record is None else record
+
+    def __contains__(self, ifsc):
+        return self.get(ifsc) is not None
+
+    def resolveMany(self, ifsc_list, district_list):
+        ifsc_list = list(ifsc_list)
+        details = self.request({
+            "op": "resolve",
+            "ifsc": ifsc_list,
+            "districts": list(district_list),
+        })
+        details["ifsc"] = ifsc_list
+        return details
+
+    def getDistrict(self, ifsc, district_list):
+        return self.resolveMany([ifsc], district_list)["district"][0]
+
+    def suggest(self, ifsc, max_distance=2, limit=5):
+        return self.request({"op": "suggest", "ifsc": ifsc, "limit": limit})["suggestions"]
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+
+# =========================== [ @DAEMON_FUNCTIONS ] =========================== #
+
+
+def answerRequest(dataset, request):
+    """
+    Parameters: (dataset, request)
+        - dataset: IfscStore (or partition) to answer from
+        - request: Decoded request of the IfscRequestHandler protocol
+    Returns: Response of the protocol
+    """
+    op = request.get("op")
+
+    if op == "ping":
+        return {"ok": True}
+
+    if op == "get":
+        record = dataset.get(request["ifsc"])
+        return {"record": dict(record) if record else None}
+
+    if op == "resolve":
+        return dataset.resolveMany(request["ifsc"], request["districts"])
+
+    if op == "suggest":
+        limit = request.get("limit", 5)
+        return {"suggestions": dataset.suggest(request["ifsc"], limit=limit)}
+
+    return {"error": f"Unknown op: {op}"}
+
+
+def openDaemonSocket(socket_path):
+    """
+    Parameter: Path of the daemon Unix socket
+    Returns: Socket connected to a daemon that answered a ping, None if no
+             daemon is running (or Unix sockets are unsupported)
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CLIENT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps({"op": "ping"}).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            response = json.loads(reader.readline())
+        if not response.get("ok"):
+            raise ValueError(response)
+    except (OSError, ValueError):
+        sock.close()
+        return None
+
+    sock.settimeout(None)
+    return sock
+
+
+def connectIfscDaemon(socket_path, loadFallback=None):
+    """
+    Parameters: (socket_path, loadFallback)
+        - socket_path: Path of the daemon Unix socket
+        - loadFallback: Function loading the dataset in process, for when
+                        the daemon goes away mid-session (optional)
+    Returns:
+        - RemoteIfscStore: If a daemon is answering on socket_path
+        - None: If no daemon is running (or Unix sockets are unsupported)
+    """
+    sock = openDaemonSocket(socket_path)
+    if sock is None:
+        return None
+    return RemoteIfscStore(sock, socket_path, loadFallback)
+
+
+def main():
+    """
+    Serves the IFSC dataset on a Unix socket until interrupted
+    """
+    var = cfg.initVarCommon()
+    socket_path = var["ifsc_socket_path"]
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("❌ Unix sockets are not supported on this platform")
+        return
+
+    if connectIfscDaemon(socket_path):
+        print(f"ℹ️ IFSC Daemon already running at {socket_path}")
+        return
+    # Leftover socket of a daemon that did not shut down cleanly
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    def loadDataset():
+        return ifscIndex.loadIfscIndex(
+            var["ifsc_dataset_path"],
+            var["ifsc_index_path"],
+            ifscIndex.loadIfscStore,
+            var["district_dataset"],
+        )
+
+    print("🔵 Loading IFSC Dataset")
+    server = IfscDaemon(socket_path, var["ifsc_dataset_path"], loadDataset)
+    print(f"✅ IFSC Daemon listening at {socket_path} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+        print("🔵 IFSC Daemon stopped")
+
+
+if __name__ == "__main__":
+    main()
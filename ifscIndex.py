@@ -0,0 +1,975 @@
+import hashlib      # CSV content hash
+import csv          # CSV file manipulation
+import pickle       # Compiled snapshot serialization
+import os           # File stats and atomic replace
+import shutil       # Copying new dataset releases
+import tempfile     # Unique files for atomic writes
+import bisect       # Sorted array lookups
+import string       # IFSC alphabet
+from collections.abc import Mapping  # Read-only dict interface
+from collections import Counter     # Most Common Value
+from array import array             # Compact integer columns
+from pathlib import Path            # OS Independent filepath
+
+# Bump whenever the layout of the compiled snapshot changes
+INDEX_VERSION = 4
+
+# Record keys in the order loadIfscDataset() always produced them
+IFSC_FIELDS = ("Bank", "Branch", "Centre", "District", "State", "Address", "City")
+# Heavily repeating columns, stored as indices into a shared vocabulary
+VOCAB_FIELDS = ("Bank", "Centre", "District", "State", "City")
+# Mostly unique columns, stored as one UTF-8 blob with offsets
+BLOB_FIELDS = ("Branch", "Address")
+
+# Characters that can appear in an IFSC code
+IFSC_ALPHABET = string.ascii_uppercase + string.digits
+# Look-alike characters operators commonly mistype for each other
+CONFUSABLE_PAIRS = {
+    frozenset("O0"), frozenset("I1"), frozenset("L1"), frozenset("S5"),
+    frozenset("B8"), frozenset("Z2"), frozenset("G6"), frozenset("D0"),
+}
+
+
+# ============================ [ @STORE_CLASSES ] ============================ #
+
+
+class IfscRecord(Mapping):
+    """
+    Read-only row view into an IfscStore. Behaves like the dictionary that
+    loadIfscDataset() used to return for a single IFSC code:
+
+    record = {
+        'Bank': ..., 'Branch': ..., 'Centre': ..., 'District': ...,
+        'State': ..., 'Address': ..., 'City': ...,
+    }
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store, row):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._store.getValue(self._row, key)
+
+    def __iter__(self):
+        return iter(IFSC_FIELDS)
+
+    def __len__(self):
+        return len(IFSC_FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class IfscStore(Mapping):
+    """
+    Columnar, string-interned replacement for the dict-of-dicts dataset.
+
+    - VOCAB_FIELDS: array of indices into a per-column vocabulary
+    - BLOB_FIELDS: one UTF-8 blob per column sliced with an offset array
+    - store.get(ifsc) returns an IfscRecord or None, like dict.get()
+    - store.getDistrict(ifsc, district_list) is a precomputed table lookup,
+      one table is kept per district list it was asked for
+    """
+    __slots__ = (
+        "_codes", "_index", "_vocab", "_columns", "_blobs", "_offsets",
+        "_district_tables",
+        "_suggestions",
+    )
+
+    def __init__(self):
+        self._codes = []
+        self._index = {}
+        self._vocab = {field: [] for field in VOCAB_FIELDS}
+        self._columns = {field: array("I") for field in VOCAB_FIELDS}
+        self._blobs = {field: b"" for field in BLOB_FIELDS}
+        self._offsets = {field: array("q", [0]) for field in BLOB_FIELDS}
+        self._district_tables = {}
+        self._suggestions = None
+
+    @classmethod
+    def fromRecords(cls, records):
+        """
+        Parameter: Iterable of (ifsc, record) where record has IFSC_FIELDS keys
+        Returns: IfscStore holding the records
+
+        A repeated IFSC code points to its last record, like dict assignment.
+        """
+        store = cls()
+        lookup = {field: {} for field in VOCAB_FIELDS}
+        chunks = {field: [] for field in BLOB_FIELDS}
+        for ifsc, record in records:
+            store._index[ifsc] = len(store._codes)
+            store._codes.append(ifsc)
+            for field in VOCAB_FIELDS:
+                value = record[field]
+                vocab_id = lookup[field].get(value)
+                if vocab_id is None:
+                    vocab_id = len(store._vocab[field])
+                    lookup[field][value] = vocab_id
+                    store._vocab[field].append(value)
+                store._columns[field].append(vocab_id)
+            for field in BLOB_FIELDS:
+                encoded = record[field].encode("utf-8")
+                chunks[field].append(encoded)
+                offsets = store._offsets[field]
+                offsets.append(offsets[-1] + len(encoded))
+
+        for field in BLOB_FIELDS:
+            store._blobs[field] = b"".join(chunks[field])
+        return store
+
+    def diffRecords(self, records):
+        """
+        Parameter: Iterable of (ifsc, record) of a new dataset release
+        Returns: Rows that differ between the store and the new release
+
+        delta = {
+            "added": {ifsc: record},
+            "removed": [ifsc],
+            "changed": {ifsc: record},
+        }
+        """
+        added = {}
+        changed = {}
+        seen = set()
+        for ifsc, record in records:
+            seen.add(ifsc)
+            current = self.get(ifsc)
+            if current is None:
+                added[ifsc] = record
+            elif any(current[field] != record[field] for field in IFSC_FIELDS):
+                changed[ifsc] = record
+
+        removed = [ifsc for ifsc in self._index if ifsc not in seen]
+        delta = {"added": added, "removed": removed, "changed": changed}
+        return delta
+
+    def applyDelta(self, delta):
+        """
+        Parameter: Output of diffRecords()
+        Returns: New IfscStore with the delta applied
+
+        Unchanged rows are copied from this store, and district tables are
+        only resolved again for added and changed rows.
+        """
+        added = delta["added"]
+        changed = delta["changed"]
+        removed = set(delta["removed"])
+
+        def records():
+            for ifsc in self._index:
+                if ifsc in removed:
+                    continue
+                yield ifsc, changed.get(ifsc) or self[ifsc]
+            yield from added.items()
+
+        store = IfscStore.fromRecords(records())
+
+        for key, (vocab, column) in self._district_tables.items():
+            district_list = list(key)
+            canonical = getCanonicalDistricts(district_list)
+            new_vocab = list(vocab)
+            lookup = {district: i for i, district in enumerate(new_vocab)}
+            new_column = array("I")
+            for row, ifsc in enumerate(store._codes):
+                if ifsc in added or ifsc in changed:
+                    record = IfscRecord(store, row)
+                    district = resolveDistrict(record, district_list, canonical)
+                    district_id = lookup.get(district)
+                    if district_id is None:
+                        district_id = len(new_vocab)
+                        lookup[district] = district_id
+                        new_vocab.append(district)
+                else:
+                    district_id = column[self._index[ifsc]]
+                new_column.append(district_id)
+            store._district_tables[key] = new_vocab, new_column
+
+        return store
+
+    def select(self, ifsc_list):
+        """
+        Parameter: IFSC codes to keep
+        Returns: New IfscStore with only those codes, district tables included
+        """
+        rows = [self._index[ifsc] for ifsc in ifsc_list]
+        store = IfscStore.fromRecords((self._codes[row], self[self._codes[row]]) for row in rows)
+        for key, (vocab, column) in self._district_tables.items():
+            store._district_tables[key] = vocab, array("I", (column[row] for row in rows))
+        return store
+
+    def getValue(self, row, field):
+        """
+        Parameters: (row, field)
+        Returns: Value of field for the row number
+        """
+        if field in self._columns:
+            return self._vocab[field][self._columns[field][row]]
+        if field in self._blobs:
+            offsets = self._offsets[field]
+            return self._blobs[field][offsets[row]:offsets[row + 1]].decode("utf-8")
+        raise KeyError(field)
+
+    def hasDistrictTable(self, district_list):
+        """
+        Returns: True if the district table was built for district_list
+        """
+        return tuple(district_list) in self._district_tables
+
+    def buildDistrictTable(self, district_list):
+        """
+        Parameter: District Dataset (config.loadDistrictDataset)
+
+        Resolves the canonical district of every row once, with the same
+        result resolveDistrict() gives for the row. Rows sharing a District
+        value that is already in district_list are resolved together.
+        """
+        lookup = {}
+        vocab = []
+        column = array("I")
+        canonical = getCanonicalDistricts(district_list)
+        district_ids = self._columns["District"]
+        direct = {}
+        for row in range(len(self._codes)):
+            vocab_id = district_ids[row]
+            district = direct.get(vocab_id)
+            if district is None:
+                value = self._vocab["District"][vocab_id]
+                district = canonical.get(value.lower(), value)
+                if district not in district_list:
+                    # Rows of this District value need the full algorithm
+                    record = IfscRecord(self, row)
+                    district = resolveDistrict(record, district_list, canonical)
+                else:
+                    direct[vocab_id] = district
+            district_id = lookup.get(district)
+            if district_id is None:
+                district_id = len(vocab)
+                lookup[district] = district_id
+                vocab.append(district)
+            column.append(district_id)
+
+        self._district_tables[tuple(district_list)] = vocab, column
+
+    def getDistrictTable(self, district_list):
+        """
+        Parameter: District Dataset
+        Returns: (vocab, column) district table, built on first use
+        """
+        if not self.hasDistrictTable(district_list):
+            self.buildDistrictTable(district_list)
+        return self._district_tables[tuple(district_list)]
+
+    def getDistrict(self, ifsc, district_list):
+        """
+        Parameters: (ifsc, district_list)
+        Returns: Canonical district of ifsc, "Unknown" if not in dataset
+        """
+        row = self._index.get(ifsc)
+        if row is None:
+            return "Unknown"
+        district_vocab, district_column = self.getDistrictTable(district_list)
+        return district_vocab[district_column[row]]
+
+    def resolveMany(self, ifsc_list, district_list):
+        """
+        Parameters: (ifsc_list, district_list)
+            - ifsc_list: Iterable of IFSC codes (list, tuple, pandas Series)
+            - district_list: District Dataset
+
+        Returns: Aligned lists, one entry per code in ifsc_list
+
+        details = {
+            "ifsc": [ifsc1, ifsc2, ...],
+            "valid": [True, False, ...],
+            "bank": [bank1, "", ...],
+            "branch": [branch1, "", ...],
+            "district": [district1, "Unknown", ...],
+        }
+
+        Each distinct code is resolved once, columns are read per row number.
+        """
+        district_vocab, district_column = self.getDistrictTable(district_list)
+
+        ifsc_list = list(ifsc_list)
+        rows = {}
+        for ifsc in ifsc_list:
+            if ifsc not in rows:
+                rows[ifsc] = self._index.get(ifsc) if isinstance(ifsc, str) else None
+
+        bank_ids = self._columns["Bank"]
+        bank_vocab = self._vocab["Bank"]
+        resolved = {}
+        for ifsc, row in rows.items():
+            if row is None:
+                resolved[ifsc] = (False, "", "", "Unknown")
+                continue
+            resolved[ifsc] = (
+                True,
+                bank_vocab[bank_ids[row]],
+                self.getValue(row, "Branch"),
+                district_vocab[district_column[row]],
+            )
+
+        columns = list(zip(*[resolved[ifsc] for ifsc in ifsc_list])) or [(), (), (), ()]
+        details = {
+            "ifsc": ifsc_list,
+            "valid": list(columns[0]),
+            "bank": list(columns[1]),
+            "branch": list(columns[2]),
+            "district": list(columns[3]),
+        }
+        return details
+
+    def suggest(self, ifsc, max_distance=2, limit=5):
+        """
+        Parameters: (ifsc, max_distance, limit)
+        Returns: Valid IFSC codes closest to a mistyped ifsc (see IfscSuggestionIndex)
+
+        The suggestion index is built on the first call and kept in memory.
+        """
+        if self._suggestions is None:
+            self._suggestions = IfscSuggestionIndex(list(self._index))
+        return self._suggestions.suggest(ifsc, max_distance, limit)
+
+    def __getitem__(self, ifsc):
+        return IfscRecord(self, self._index[ifsc])
+
+    def get(self, ifsc, default=None):
+        row = self._index.get(ifsc)
+        if row is None:
+            return default
+        return IfscRecord(self, row)
+
+    def __contains__(self, ifsc):
+        return ifsc in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getstate__(self):
+        # Row codes are joined into one string, the index is rebuilt on load
+        return {
+            "codes": "\n".join(self._codes),
+            "vocab": self._vocab,
+            "columns": self._columns,
+            "blobs": self._blobs,
+            "offsets": self._offsets,
+            "district_tables": self._district_tables,
+        }
+
+    def __setstate__(self, state):
+        self._codes = state["codes"].split("\n") if state["codes"] else []
+        self._index = dict(zip(self._codes, range(len(self._codes))))
+        self._vocab = state["vocab"]
+        self._columns = state["columns"]
+        self._blobs = state["blobs"]
+        self._offsets = state["offsets"]
+        self._district_tables = state["district_tables"]
+        self._suggestions = None
+
+
+class IfscSuggestionIndex:
+    """
+    Finds valid IFSC codes within a small edit distance of a mistyped code.
+
+    For every position of every code, the code with that position blanked
+    out is hashed into a sorted array (one array per position). A lookup
+    of a blanked query returns every code differing from it in at most that
+    position, so single substitutions cost one bisect per position, and a
+    missing character is a blank inserted into the query. Every other edit
+    (transpositions, extra characters, and for distance 2 a first missing
+    or substituted character) is applied to the query first, so each lookup
+    only has to cover the last edit. Candidates are verified with the real
+    edit distance before being returned.
+    """
+    __slots__ = ("_codes", "_row_bits", "_buckets")
+
+    def __init__(self, codes):
+        self._codes = codes
+        self._row_bits = max(20, len(codes).bit_length())
+        self._buckets = {}
+
+        hash_mask = (1 << (63 - self._row_bits)) - 1
+        by_position = {}
+        for row, code in enumerate(codes):
+            for i in range(len(code)):
+                masked = code[:i] + "*" + code[i + 1:]
+                key = ((hash(masked) & hash_mask) << self._row_bits) | row
+                by_position.setdefault((len(code), i), []).append(key)
+
+        for position, keys in by_position.items():
+            keys.sort()
+            self._buckets[position] = array("q", keys)
+
+    def _probe(self, query, rows, missing=True):
+        """
+        Adds rows of codes differing from query in at most one position, or
+        (missing=True) missing one character of the code
+        """
+        for i in range(len(query)):
+            self._probeAt(query[:i] + "*" + query[i + 1:], i, rows)
+        if missing:
+            for i in range(len(query) + 1):
+                self._probeAt(query[:i] + "*" + query[i:], i, rows)
+
+    def _probeAt(self, masked, i, rows):
+        """
+        Adds rows of codes matching masked everywhere but position i
+        """
+        bucket = self._buckets.get((len(masked), i))
+        if bucket is None:
+            return
+        hash_mask = (1 << (63 - self._row_bits)) - 1
+        row_mask = (1 << self._row_bits) - 1
+        prefix = hash(masked) & hash_mask
+        k = bisect.bisect_left(bucket, prefix << self._row_bits)
+        while k < len(bucket) and bucket[k] >> self._row_bits == prefix:
+            rows.add(bucket[k] & row_mask)
+            k += 1
+
+    def suggest(self, ifsc, max_distance=2, limit=5):
+        """
+        Parameters: (ifsc, max_distance, limit)
+            - ifsc: Mistyped IFSC code
+            - max_distance: Maximum edit distance (1 or 2)
+            - limit: Maximum number of suggestions
+
+        Returns: List of valid IFSC codes, closest and look-alike typos first
+        """
+        if not isinstance(ifsc, str):
+            return []
+        query = ifsc.strip().upper()
+        if not query:
+            return []
+
+        # _probe() covers the last edit (substitution / missing character),
+        # seeds are the query with every other possible edit applied first
+        rows = set()
+        edits = getSwapsAndDeletions(query)
+        for seed in edits | {query}:
+            self._probe(seed, rows)
+
+        if max_distance >= 2:
+            # Two characters missing, or one missing and one substituted
+            for i in range(len(query) + 1):
+                for char in IFSC_ALPHABET:
+                    self._probe(query[:i] + char + query[i:], rows)
+            # Two substituted
+            for i in range(len(query)):
+                for char in IFSC_ALPHABET:
+                    self._probe(query[:i] + char + query[i + 1:], rows, missing=False)
+            # Two swaps / extra characters leave nothing for _probe() to do
+            for seed in edits:
+                for code in getSwapsAndDeletions(seed):
+                    if code:
+                        self._probeAt("*" + code[1:], 0, rows)
+
+        ranked = []
+        for row in rows:
+            code = self._codes[row]
+            distance = getEditDistance(query, code)
+            if 0 < distance <= max_distance:
+                ranked.append((distance, -countConfusables(query, code), code))
+        ranked.sort()
+        return [code for _, _, code in ranked[:limit]]
+
+
+def getSwapsAndDeletions(query):
+    """
+    Returns: Set of query with one adjacent pair swapped or one character
+             removed, edits that need no guessing of a character
+    """
+    edits = set()
+    for i in range(len(query) - 1):
+        edits.add(query[:i] + query[i + 1] + query[i] + query[i + 2:])
+    for i in range(len(query)):
+        edits.add(query[:i] + query[i + 1:])
+    return edits
+
+
+def getEditDistance(a, b):
+    """
+    Parameters: (a, b) Strings to compare
+    Returns: Edit distance counting adjacent swaps as a single edit
+    """
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            swapped = a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+            if i > 1 and j > 1 and swapped:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+def countConfusables(a, b):
+    """
+    Returns: Number of aligned characters of a and b that are look-alikes
+    """
+    count = 0
+    for char_a, char_b in zip(a, b):
+        if frozenset((char_a, char_b)) in CONFUSABLE_PAIRS:
+            count += 1
+    return count
+
+
+# ========================== [ @PARTITION_CLASSES ] ========================== #
+
+
+class IfscCodeSet:
+    """
+    Compact set of every IFSC code, kept as one sorted ASCII blob of fixed
+    width codes. Answers membership without holding the rows themselves.
+    """
+    __slots__ = ("_blob", "_width", "_extra")
+
+    def __init__(self, ifsc_list):
+        ifsc_list = sorted(set(ifsc_list))
+        self._width = len(ifsc_list[0]) if ifsc_list else 11
+        fixed = [ifsc for ifsc in ifsc_list if len(ifsc) == self._width and ifsc.isascii()]
+        self._blob = "".join(fixed).encode("ascii")
+        # Codes not fitting the fixed width (not seen in RazorPay releases)
+        self._extra = frozenset(ifsc_list) - frozenset(fixed)
+
+    def __contains__(self, ifsc):
+        if not isinstance(ifsc, str):
+            return False
+        if len(ifsc) != self._width or not ifsc.isascii():
+            return ifsc in self._extra
+        key = ifsc.encode("ascii")
+        width = self._width
+        low, high = 0, len(self._blob) // width
+        while low < high:
+            mid = (low + high) // 2
+            value = self._blob[mid * width:(mid + 1) * width]
+            if value < key:
+                low = mid + 1
+            elif value > key:
+                high = mid
+            else:
+                return True
+        return False
+
+    def __iter__(self):
+        width = self._width
+        for start in range(0, len(self._blob), width):
+            yield self._blob[start:start + width].decode("ascii")
+        yield from self._extra
+
+    def __len__(self):
+        return len(self._blob) // self._width + len(self._extra)
+
+
+class PartitionedIfscStore:
+    """
+    IFSC dataset loaded in two parts:
+
+    - hot: IfscStore with rows of the configured states and banks
+    - codes: IfscCodeSet of every code, so invalid codes are known misses
+    - loadFull(): returns the complete IfscStore, called on the first
+      lookup of a valid code outside the hot partition
+
+    Lookups return the same values as the complete IfscStore would.
+    """
+
+    def __init__(self, hot, codes, loadFull):
+        self.hot = hot
+        self.codes = codes
+        self.loadFull = loadFull
+        self.full = None
+        self.suggestions = None
+
+    def getFull(self):
+        if self.full is None:
+            print("ℹ️ Loading IFSC Dataset of other states")
+            self.full = self.loadFull()
+        return self.full
+
+    def get(self, ifsc, default=None):
+        record = self.hot.get(ifsc)
+        if record is not None:
+            return record
+        if ifsc in self.codes:
+            return self.getFull().get(ifsc, default)
+        return default
+
+    def __contains__(self, ifsc):
+        return ifsc in self.codes
+
+    def __getitem__(self, ifsc):
+        record = self.get(ifsc)
+        if record is None:
+            raise KeyError(ifsc)
+        return record
+
+    def __iter__(self):
+        return iter(self.codes)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def getDistrict(self, ifsc, district_list):
+        if ifsc in self.hot:
+            return self.hot.getDistrict(ifsc, district_list)
+        if ifsc in self.codes:
+            return self.getFull().getDistrict(ifsc, district_list)
+        return "Unknown"
+
+    def resolveMany(self, ifsc_list, district_list):
+        ifsc_list = list(ifsc_list)
+        cold = any(ifsc not in self.hot and ifsc in self.codes for ifsc in ifsc_list)
+        dataset = self.getFull() if cold else self.hot
+        return dataset.resolveMany(ifsc_list, district_list)
+
+    def suggest(self, ifsc, max_distance=2, limit=5):
+        if self.suggestions is None:
+            self.suggestions = IfscSuggestionIndex(list(self.codes))
+        return self.suggestions.suggest(ifsc, max_distance, limit)
+
+
+# ========================== [ @DISTRICT_FUNCTIONS ] ========================== #
+
+
+def getCanonicalDistricts(district_list):
+    """
+    Parameter: District Dataset
+    Returns: Lowercase district name mapped to its item in district_list
+    """
+    canonical = {}
+    for item in district_list:
+        canonical[item.lower()] = item
+    return canonical
+
+
+def resolveDistrict(ifsc_info, district_list, canonical=None):
+    """
+    Parameters: (ifsc_info, district_list, canonical)
+        - ifsc_info: Record of a single IFSC code from the dataset
+        - district_list: District Dataset
+        - canonical: Output of getCanonicalDistricts(district_list), optional
+
+    Returns: District as a String
+
+    Resolution stages:
+    1. District column of the record
+    2. Most common value of the record (District Finder v2.0)
+    3. First district named in the Address (District Finder v1.0)
+    """
+    if canonical is None:
+        canonical = getCanonicalDistricts(district_list)
+
+    # District Finder (Initial Algorithm)
+    district = ifsc_info["District"]
+    district = canonical.get(district.lower(), district)
+
+    # District Finder v2.0 (New Algorithm)
+    if district not in district_list:
+        count = Counter(ifsc_info.values())
+        district = count.most_common(1)[0][0]
+        district = canonical.get(district.lower(), district)
+
+    # District Finder v1.0 (Fallback)
+    if district not in district_list:
+        address = ifsc_info["Address"].lower()
+        for item in district_list:
+            if item.lower() in address:
+                district = item
+        district = canonical.get(district.lower(), district)
+
+    return district
+
+
+# ========================== [ @SNAPSHOT_FUNCTIONS ] ========================== #
+
+
+def loadIfscStore(csv_file):
+    """
+    Parameter: CSV Dataset from RazorPay
+    Returns: IfscStore compiled from the CSV
+    """
+    return IfscStore.fromRecords(readIfscCsv(csv_file))
+
+
+def readIfscCsv(csv_file):
+    """
+    Parameter: CSV Dataset from RazorPay
+    Yields: (ifsc, record) for every row of the CSV
+
+    record = {
+        'Bank': row['BANK'],
+        'Branch': row['BRANCH'],
+        'Centre': row['CENTRE'],
+        'District': row['DISTRICT'],
+        'State': row['STATE'],
+        'Address': row['ADDRESS'],
+        'City': row['CITY'],
+    }
+    """
+    with open(csv_file, mode='r', encoding='utf-8') as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            record = {
+                'Bank': row['BANK'],
+                'Branch': row['BRANCH'],
+                'Centre': row['CENTRE'],
+                'District': row['DISTRICT'],
+                'State': row['STATE'],
+                'Address': row['ADDRESS'],
+                'City': row['CITY'],
+            }
+            yield row['IFSC'], record
+
+
+def getFileHash(file):
+    """
+    Parameter: Path to a file
+    Returns: SHA-256 hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(file, mode='rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def getCsvSignature(csv_file, with_hash=True):
+    """
+    Parameters: (csv_file, with_hash)
+        - csv_file: CSV Dataset from RazorPay
+        - with_hash: Also compute the content hash (slow on large files)
+
+    Returns: Signature identifying the current state of the CSV
+
+    signature = {
+        "size": file_size_in_bytes,
+        "mtime": modification_time_in_ns,
+        "sha256": content_hash or None,
+    }
+    """
+    stat = os.stat(csv_file)
+    signature = {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "sha256": getFileHash(csv_file) if with_hash else None,
+    }
+    return signature
+
+
+def readIfscSnapshot(index_file):
+    """
+    Parameter: Path to compiled IFSC snapshot
+    Returns: Snapshot dictionary or None if missing / unreadable / outdated
+
+    snapshot = {
+        "version": INDEX_VERSION,
+        "source": getCsvSignature(),
+        "dataset": IfscStore,
+    }
+    """
+    try:
+        with open(index_file, mode='rb') as file:
+            snapshot = pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        return None
+
+    if not isinstance(snapshot, dict):
+        return None
+    if snapshot.get("version") != INDEX_VERSION:
+        return None
+    return snapshot
+
+
+def writeIfscSnapshot(index_file, snapshot):
+    """
+    Writes snapshot next to its final location and atomically swaps it in,
+    so an interrupted write never leaves a half written index behind.
+    """
+    replaceAtomically(
+        index_file,
+        lambda file: pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL),
+    )
+
+
+def replaceAtomically(dest_file, write):
+    """
+    Arguments: (dest_file, write)
+        - dest_file: File to replace
+        - write: Function writing the new contents to a binary file object
+
+    Writes to a temporary file of its own in the same directory and swaps
+    it in, so processes writing at once never share a temporary file. If
+    the swap fails because another process swapped in its copy at the same
+    time (Windows), that copy is kept.
+    """
+    dest_file = Path(dest_file)
+    dest_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=dest_file.parent, prefix=dest_file.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode='wb') as file:
+            write(file)
+        # mkstemp() files are private to the user, keep the usual mode
+        if dest_file.exists():
+            shutil.copymode(dest_file, tmp_file)
+        else:
+            os.chmod(tmp_file, 0o644)
+        try:
+            os.replace(tmp_file, dest_file)
+        except PermissionError:
+            if not dest_file.exists():
+                raise
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def isSnapshotFresh(snapshot, csv_file):
+    """
+    Parameters: (snapshot, csv_file)
+    Returns: True if snapshot was compiled from the current CSV
+
+    Size and mtime are compared first. When only the mtime differs (file
+    copied or touched), the content hash decides and the stored signature
+    is refreshed in place.
+    """
+    source = snapshot["source"]
+    current = getCsvSignature(csv_file, with_hash=False)
+
+    if current["size"] != source["size"]:
+        return False
+    if current["mtime"] == source["mtime"]:
+        return True
+
+    if getFileHash(csv_file) != source["sha256"]:
+        return False
+    source["mtime"] = current["mtime"]
+    return True
+
+
+def loadIfscIndex(csv_file, index_file, loader, district_list=None):
+    """
+    Parameters: (csv_file, index_file, loader, district_list)
+        - csv_file: CSV Dataset from RazorPay
+        - index_file: Path of compiled snapshot for the CSV
+        - loader: Function parsing csv_file into the dataset (loadIfscDataset)
+        - district_list: District Dataset to precompute district table for
+
+    Returns: Dataset loaded from snapshot, recompiled if the CSV has changed
+    """
+    snapshot = readIfscSnapshot(index_file)
+
+    if snapshot is not None:
+        mtime = snapshot["source"]["mtime"]
+        if isSnapshotFresh(snapshot, csv_file):
+            dataset = snapshot["dataset"]
+            outdated = snapshot["source"]["mtime"] != mtime
+            if district_list and not dataset.hasDistrictTable(district_list):
+                dataset.buildDistrictTable(district_list)
+                outdated = True
+            # Store refreshed mtime and district table for the next run
+            if outdated:
+                writeIfscSnapshot(index_file, snapshot)
+            return dataset
+
+    print("ℹ️ Compiling IFSC Dataset")
+    snapshot = {
+        "version": INDEX_VERSION,
+        "source": getCsvSignature(csv_file),
+        "dataset": loader(csv_file),
+    }
+    if district_list:
+        snapshot["dataset"].buildDistrictTable(district_list)
+    writeIfscSnapshot(index_file, snapshot)
+    return snapshot["dataset"]
+
+
+def installIfscRelease(new_csv_file, csv_file, index_file, dataset):
+    """
+    Parameters: (new_csv_file, csv_file, index_file, dataset)
+        - new_csv_file: New CSV release from RazorPay
+        - csv_file: Location of the current CSV Dataset
+        - index_file: Path of compiled snapshot for the CSV
+        - dataset: IfscStore already holding the new release
+
+    Copies the new release over the current CSV and stores dataset as its
+    snapshot, so the next run does not compile the release again.
+    """
+    csv_file = Path(csv_file)
+    with open(new_csv_file, mode='rb') as new_file:
+        replaceAtomically(csv_file, lambda file: shutil.copyfileobj(new_file, file))
+
+    snapshot = {
+        "version": INDEX_VERSION,
+        "source": getCsvSignature(csv_file),
+        "dataset": dataset,
+    }
+    writeIfscSnapshot(index_file, snapshot)
+
+
+def loadIfscPartition(csv_file, index_file, hot_index_file, loader,
+                      district_list=None, states=(), banks=()):
+    """
+    Parameters: (csv_file, index_file, hot_index_file, loader, district_list, states, banks)
+        - csv_file, index_file, loader, district_list: As in loadIfscIndex()
+        - hot_index_file: Path of compiled snapshot for the hot partition
+        - states: State names kept in memory (eg: ["Kerala"])
+        - banks: Bank codes kept in memory, first 4 letters of IFSC (eg: ["FDRL"])
+
+    Returns: PartitionedIfscStore holding only the hot rows in memory
+
+    The complete dataset is loaded from index_file when a lookup misses
+    the hot partition, so lookup results are the same as loadIfscIndex().
+    """
+    partition = {
+        "states": sorted(state.upper() for state in states),
+        "banks": sorted(bank.upper() for bank in banks),
+    }
+
+    def loadFull():
+        return loadIfscIndex(csv_file, index_file, loader, district_list)
+
+    snapshot = readIfscSnapshot(hot_index_file)
+    if snapshot is not None and snapshot.get("partition") == partition:
+        mtime = snapshot["source"]["mtime"]
+        hot = snapshot["dataset"]
+        if isSnapshotFresh(snapshot, csv_file):
+            outdated = snapshot["source"]["mtime"] != mtime
+            if district_list and not hot.hasDistrictTable(district_list):
+                hot.buildDistrictTable(district_list)
+                outdated = True
+            if outdated:
+                writeIfscSnapshot(hot_index_file, snapshot)
+            return PartitionedIfscStore(hot, snapshot["codes"], loadFull)
+
+    full = loadFull()
+    states = set(partition["states"])
+    banks = set(partition["banks"])
+    hot_list = [
+        ifsc for ifsc in full
+        if full.get(ifsc)["State"].upper() in states or ifsc[:4].upper() in banks
+    ]
+    snapshot = {
+        "version": INDEX_VERSION,
+        "source": getCsvSignature(csv_file),
+        "partition": partition,
+        "dataset": full.select(hot_list),
+        "codes": IfscCodeSet(full),
+    }
+    writeIfscSnapshot(hot_index_file, snapshot)
+
+    dataset = PartitionedIfscStore(snapshot["dataset"], snapshot["codes"], loadFull)
+    dataset.full = full
+    return dataset
@@ -1,36 +1,66 @@
 import config
 import processForms
+import processFormsBatch
+import formWatcher
+import processValidate
 import processBranch
 import processSpreadsheet
 import processDatabase
 import riteOfPassage
 import processNEFT
 import processFinal
+import ifscDaemon
+import processIfscUpdate
 from sys import exit
+from multiprocessing import freeze_support
 
-command = riteOfPassage.main()
-cmd = config.initVarCmd()
+if __name__ == "__main__":
+    # Form parsing workers re-import this module, only run commands once
+    freeze_support()
 
-if command == cmd["form"]:
-    processForms.main()
-    exit(0)
+    command = riteOfPassage.main()
+    cmd = config.initVarCmd()
 
-if command == cmd["db"]:
-    processDatabase.main()
-    exit(0)
+    if command == cmd["form"]:
+        processForms.main()
+        exit(0)
 
-if command == cmd["ifsc"]:
-    processBranch.main()
-    exit(0)
+    if command == cmd["batch"]:
+        processFormsBatch.main()
+        exit(0)
 
-if command == cmd["final"]:
-    processFinal.main()
-    exit(0)
+    if command == cmd["watch"]:
+        formWatcher.main()
+        exit(0)
 
-if command == cmd["excel"]:
-    processSpreadsheet.main()
-    exit(0)
+    if command == cmd["validate"]:
+        processValidate.main()
+        exit(0)
 
-if command == cmd["bank"]:
-    processNEFT.main()
-    exit(0)
+    if command == cmd["db"]:
+        processDatabase.main()
+        exit(0)
+
+    if command == cmd["ifsc"]:
+        processBranch.main()
+        exit(0)
+
+    if command == cmd["daemon"]:
+        ifscDaemon.main()
+        exit(0)
+
+    if command == cmd["update"]:
+        processIfscUpdate.main()
+        exit(0)
+
+    if command == cmd["final"]:
+        processFinal.main()
+        exit(0)
+
+    if command == cmd["excel"]:
+        processSpreadsheet.main()
+        exit(0)
+
+    if command == cmd["bank"]:
+        processNEFT.main()
+        exit(0)
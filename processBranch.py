@@ -3,6 +3,7 @@ import pyperclip    # Clipboard handling
 import threading    # Multithreading Stuff
 from function import var
 from function import updateIfscInVar
+from function import getIfscDetailsList
 
 
 def main():
@@ -24,11 +25,8 @@ def getBranchFromPastedIfsc():
     csv_thread.join()
     ifsc_dataset = var["ifsc_dataset"]
 
-    branch_list = []
-    for ifsc in text:
-        ifsc = ifsc.strip()
-        branch = getBranchFromIfsc(ifsc, ifsc_dataset)
-        branch_list.append(branch)
+    ifsc_list = [ifsc.strip() for ifsc in text]
+    branch_list = getIfscDetailsList(ifsc_list, ifsc_dataset)["branch"]
 
     # Join the list into a single string
     text = '\n'.join(branch_list)
@@ -1,6 +1,9 @@
 import sqlite3      # SQLite DB operations
 import datetime     # ISO Date format
-import shutil       # Copying and Moving files
+import os           # Vanished forms
+import formPipeline     # Background form parsing
+import sessionJournal   # Resuming interrupted runs
+import formIndex        # Where indexed forms went
 import function as fn
 from function import var
 
@@ -26,28 +29,81 @@ def main():
     incorrect_format_count = 0
     rejected_count = 0
 
-    file_list = fn.getFileList(input_dir, [".docx", ".pdf"])
+    file_list = fn.scanFiles(input_dir, [".docx", ".pdf"])
+    form_index = formIndex.FormIndex(var["form_index_path"])
+    journal = sessionJournal.openSessionJournal(var["session_dir"], f"database {district_user}", form_index)
+    pipeline = formPipeline.FormPipeline(
+        file_list,
+        var["form_prefetch"],
+        timeout=var["form_timeout"],
+        memory_limit=var["form_memory_limit"],
+        journal=journal,
+    )
     try:
-        for file in file_list:
+        for result in pipeline:
 
+            file = result["file"]
+            digest = result["hash"]
             fn.printFileNameHeader(file)
-            if fn.correctFormat(file):
+            print(result["log"], end="")
+
+            # ------------------------------------------- [ SESSION RESUME ]
+
+            # Decided before the last run stopped, finish what was left
+            decided = journal.getInterrupted(digest)
+            if decided:
+                decision = decided["decision"]
+                print(f"🔁 Decided in the interrupted session: {decision}")
+                if decision == "accept":
+                    student_data = result["student_data"]
+                    committed = journal.getResumed(digest, "committed")
+                    # Committed right before the run stopped, not journaled yet
+                    if not committed and not decided["accounts_existed"]:
+                        committed = fn.checkExistingAccounts(student_data, conn.cursor())
+                    if committed:
+                        print("✅ Already in Database")
+                    elif journal.getResumed(digest, "rejected") is None:
+                        committed = fn.writeToDB(conn, decided["district"], result["institution"], student_data)
+                    if committed:
+                        journal.record(digest, file, "committed")
+                        journal.move(digest, file, output_dir, accepted=True)
+                        files_written += 1
+                    else:
+                        journal.record(digest, file, "rejected")
+                        journal.move(digest, file, rejected_dir)
+                        rejected_count += 1
+                elif decision == "format":
+                    journal.move(digest, file, formatting_dir)
+                    incorrect_format_count += 1
+                else:
+                    journal.move(digest, file, investigation_dir)
+                    for_checking_count += 1
+                continue  # Skip to next iteration
 
-                # -------------------------------------------- [ FORM PARSING ]
+            # ---------------------------------- [ EARLY REJECTION / WATCHDOG ]
 
-                institution = fn.getInstitutionDetails(file)
-                student_data = fn.getStudentDetails(file)
+            if result["error"]:
+                print(f"⚠️ Not parsed: {result['error']}")
+                # Gone since it was found, nothing to move
+                if not os.path.exists(file):
+                    continue  # Skip to next iteration
+                print("❌ Moving for Re-Formatting.")
+                fn.logFormattingIssue(formatting_dir, file, result["error"])
+                journal.move(digest, file, formatting_dir)
+                incorrect_format_count += 1
+                continue  # Skip to next iteration
 
-                # ----------------------------------------- [ DATA PROCESSING ]
+            if result["correct"]:
+
+                # ------------------------------------ [ FORM PARSING (POOL) ]
+
+                # Parsed, cleaned, normalized and district guessed by pipeline
+                institution = result["institution"]
+                student_data = result["student_data"]
+                district_guess = result["district_guess"]
 
-                # Cleaning up Student Data for processing
-                student_data = fn.cleanStudentData(student_data)
-                # Normalizing Student Data
-                student_data = fn.normalizeStudentData(student_data)
+                # ----------------------------------------- [ DATA PROCESSING ]
 
-                # Guessing District
-                ifsc_list = fn.getStudentIfscList(student_data)
-                district_guess = fn.guessDistrictFromIfscList(ifsc_list)
                 print(f"💡 Possible District: {district_guess}")
 
                 # Printing Data
@@ -70,19 +126,26 @@ def main():
 
                 if verification is True:
                     print("✅ Marking as Correct.")
+                    # Accounts already present can't be mistaken for this commit on resume
+                    accounts_existed = fn.checkExistingAccounts(student_data, conn.cursor())
+                    journal.record(digest, file, "decided", decision="accept", district=district,
+                                   accounts_existed=accounts_existed)
                     # WRITING VERIFIED DATA INTO DATABASE
                     if fn.writeToDB(conn, district, institution, student_data):
                         print("✅ Data Written Successfully!")
-                        shutil.move(file, output_dir)
+                        journal.record(digest, file, "committed")
+                        journal.move(digest, file, output_dir, accepted=True)
                         files_written += 1
                     else:
                         print("❌ Rejected by Database")
-                        shutil.move(file, rejected_dir)
+                        journal.record(digest, file, "rejected")
+                        journal.move(digest, file, rejected_dir)
                         rejected_count += 1
                 else:
                     input("Move for Investigation? (ret) ")
+                    journal.record(digest, file, "decided", decision="investigate")
                     print("❌ Moving for further Investigation.")
-                    shutil.move(file, investigation_dir)
+                    journal.move(digest, file, investigation_dir)
                     for_checking_count += 1
 
             # ---------------------------------------- [ INCORRECT FORMATTING ]
@@ -90,12 +153,22 @@ def main():
             else:
                 print("⚠️ Formatting error detected!")
                 input("Move for checking Format? (ret) ")
+                journal.record(digest, file, "decided", decision="format")
                 print("❌ Moving for Re-Formatting.")
-                shutil.move(file, formatting_dir)
+                journal.move(digest, file, formatting_dir)
                 incorrect_format_count += 1
 
+        # Every form is done, nothing left to resume
+        journal.finish()
+
     except KeyboardInterrupt:
         print("Caught the Keyboard Interrupt ;D")
+        print("💾 Progress is journaled, run database again to resume")
+
+    finally:
+        pipeline.close()
+        journal.close()
+        form_index.close()
 
     # -------------------------------------------------------------- [ REPORT ]
 
@@ -1,6 +1,10 @@
 from sqlite3 import IntegrityError  # SQLite AccNo error
 import sqlite3  # SQLite DB operations
-import shutil  # Copying and Moving files
+import traceback    # Unexpected errors
+import os           # Vanished forms
+import formPipeline     # Background form parsing
+import sessionJournal   # Resuming interrupted runs
+import formIndex        # Duplicate forms
 import function as fn
 from function import var
 
@@ -12,29 +16,105 @@ def main():
     investigation_dir = fn.initNestedDir(input_dir, "for checking")
     formatting_dir = fn.initNestedDir(input_dir, "formatting issues")
     rejected_dir = fn.initNestedDir(input_dir, "rejected")
-    district_user = fn.getDistrictFromUser()
+    duplicates_dir = fn.initNestedDir(input_dir, "duplicates")
     files_written = 0
     for_checking_count = 0
     incorrect_format_count = 0
     rejected_count = 0
-    file_list = fn.getFileList(input_dir, [".docx", ".pdf"])
+    # Discovered and sanitized as the pipeline asks for more forms
+    file_list = fn.scanFiles(input_dir, [".docx", ".pdf"])
+    file_list = (fn.sanitizeFilename(file) for file in file_list)
+    # Copies of a form seen before are set aside without parsing
+    form_index = formIndex.FormIndex(var["form_index_path"])
+    dedup = formIndex.FormDeduplicator(form_index, duplicates_dir)
+    file_list = dedup.filterFiles(file_list)
+
+    # Loaded (and compiled if the CSV changed) once here, workers only load it
+    fn.updateIfscInVar()
+
+    # Forms start parsing in the background while the district is asked
+    journal = sessionJournal.openSessionJournal(var["session_dir"], "forms", form_index)
+    pipeline = formPipeline.FormPipeline(
+        file_list,
+        var["form_prefetch"],
+        timeout=var["form_timeout"],
+        memory_limit=var["form_memory_limit"],
+        journal=journal,
+    )
 
     print("🔵 Connecting to Database")
     conn = sqlite3.connect(db_file)
     cursor = conn.cursor()
 
     try:
-        for file in file_list:
-
+        # Started inside try, so leaving at the prompt still closes it
+        pipeline.start()
+        session = journal.get("session", "district")
+        if session:
+            district_user = session["district"]
+            print(f"✍️ District of the session: {district_user}")
+        else:
+            district_user = fn.getDistrictInput()
+            journal.record("session", "", "district", district=district_user)
+
+        for result in pipeline:
+
+            file = result["file"]
+            digest = result["hash"]
             print(f"\n{file}")
-            file = fn.sanitizeFilename(file)
+            print(result["log"], end="")
+
+            # ------------------------------------------- [ SESSION RESUME ]
+
+            # Decided before the last run stopped, only the move is left
+            decided = journal.getInterrupted(digest)
+            if decided:
+                fn.printFileNameHeader(file)
+                decision = decided["decision"]
+                print(f"🔁 Decided in the interrupted session: {decision}")
+                if decision == "accept":
+                    output_dir = fn.initNestedDir(input_dir, decided["district"])
+                    journal.move(digest, file, output_dir, accepted=True)
+                    files_written += 1
+                elif decision == "reject":
+                    journal.move(digest, file, rejected_dir)
+                    rejected_count += 1
+                elif decision == "format":
+                    journal.move(digest, file, formatting_dir)
+                    incorrect_format_count += 1
+                else:
+                    journal.move(digest, file, investigation_dir)
+                    for_checking_count += 1
+                continue  # Skip to next iteration
+
+            # ---------------------------------- [ EARLY REJECTION / WATCHDOG ]
 
-            if fn.correctFormat(file):
+            if result["error"]:
+                fn.printFileNameHeader(file)
+                print(f"⚠️ Not parsed: {result['error']}")
+                # Gone since it was found, nothing to move
+                if not os.path.exists(file):
+                    continue  # Skip to next iteration
+                print("❌ Moving for Re-Formatting.")
+                fn.logFormattingIssue(formatting_dir, file, result["error"])
+                journal.move(digest, file, formatting_dir)
+                incorrect_format_count += 1
+                continue  # Skip to next iteration
+
+            # ----------------------------------------------- [ DUPLICATE FORMS ]
 
-                # -------------------------------------------- [ FORM PARSING ]
+            # Same students as another form (eg: DOCX and PDF of one form)
+            if dedup.checkResult(result):
+                continue  # Skip to next iteration
 
-                institution = fn.getInstitutionDetails(file)
-                student_data = fn.getStudentDetails(file)
+            if result["correct"]:
+
+                # ------------------------------------ [ FORM PARSING (POOL) ]
+
+                # Parsed, cleaned, normalized and district guessed by pipeline
+                institution = result["institution"]
+                student_data = result["student_data"]
+                district_guess = result["district_guess"]
 
                 # --------------------------------------- [ FILENAME RENAMING ]
 
@@ -43,14 +123,6 @@ def main():
 
                 # ----------------------------------------- [ DATA PROCESSING ]
 
-                # Cleaning up Student Data for processing
-                student_data = fn.cleanStudentData(student_data)
-                # Normalizing Student Data
-                student_data = fn.normalizeStudentData(student_data)
-
-                # Guessing District
-                ifsc_list = fn.getStudentIfscList(student_data)
-                district_guess = fn.guessDistrictFromIfscList(ifsc_list)
                 print(f"💡 Possible District: {district_guess}")
 
                 # Check for duplicate accounts in database
@@ -62,8 +134,9 @@ def main():
                     if school_id == None:
                         print("🤨 Students detected in different schools.")
                         input("Move for Investigation? (ret) ")
+                        journal.record(digest, file, "decided", decision="investigate")
                         print("❌ Moving for further Investigation.")
-                        shutil.move(file, investigation_dir)
+                        journal.move(digest, file, investigation_dir)
                         for_checking_count += 1
                         continue  # Skip to next iteration
 
@@ -79,13 +152,15 @@ def main():
                         conn.execute("BEGIN TRANSACTION")
                         added_students, rejected_students = fn.updateClassVacancies(school_id, vacancy_list, student_data, cursor)
                         conn.commit()
+                        journal.record(digest, file, "committed", school_id=school_id)
                         print("✅ Added Students:")
                         fn.printStudentDataFrame2(added_students)
                         print("❌ Rejected Students:")
                         fn.printStudentDataFrame2(rejected_students)
 
                     input("Move to Rejected? (ret) ")
-                    shutil.move(file, rejected_dir)
+                    journal.record(digest, file, "decided", decision="reject")
+                    journal.move(digest, file, rejected_dir)
                     rejected_count += 1
                     continue  # Skip to next iteration
 
@@ -110,14 +185,16 @@ def main():
 
                 if verification is True:
                     print("✅ Marking as Correct.")
+                    journal.record(digest, file, "decided", decision="accept", district=district)
                     # SORTING VERIFIED FORM INTO DISTRICT DIRECTORY
                     output_dir = fn.initNestedDir(input_dir, district)
-                    shutil.move(file, output_dir)
+                    journal.move(digest, file, output_dir, accepted=True)
                     files_written += 1
                 else:
                     input("Move for Investigation? (ret) ")
+                    journal.record(digest, file, "decided", decision="investigate")
                     print("❌ Moving for further Investigation.")
-                    shutil.move(file, investigation_dir)
+                    journal.move(digest, file, investigation_dir)
                     for_checking_count += 1
 
             # ---------------------------------------- [ INCORRECT FORMATTING ]
@@ -126,25 +203,34 @@ def main():
                 fn.printFileNameHeader(file)
                 print("⚠️ Formatting error detected!")
                 input("Move for checking Format? (ret) ")
+                journal.record(digest, file, "decided", decision="format")
                 print("❌ Moving for Re-Formatting.")
-                shutil.move(file, formatting_dir)
+                journal.move(digest, file, formatting_dir)
                 incorrect_format_count += 1
 
+        # Every form is done, nothing left to resume
+        journal.finish()
+
     except KeyboardInterrupt:
         print("Caught the Keyboard Interrupt ;D")
+        print("💾 Progress is journaled, run forms again to resume")
     except IntegrityError as e:
         print(f"🔴 IntegrityError: {e}")
         conn.rollback()
         return False
 
-    except Exception as e:
-        print(f"Error: {e}")
+    except Exception:
+        print("🔴 Error:")
+        traceback.print_exc()
         conn.rollback()
         return False
 
     # -------------------------------------------------------------- [ REPORT ]
 
     finally:
+        pipeline.close()
+        journal.close()
+        form_index.close()
         print("🔵 Closing DB")
         conn.close()
         print("")
@@ -156,4 +242,5 @@ def main():
         print(f"For Checking      : {for_checking_count}".center(80))
         print(f"Formatting Issues : {incorrect_format_count}".center(80))
         print(f"Rejected by DB    : {rejected_count}".center(80))
+        print(f"Duplicates        : {dedup.count}".center(80))
         print(horizontal_line)
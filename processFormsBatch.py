@@ -0,0 +1,143 @@
+import sqlite3      # SQLite DB operations
+import datetime     # Report file name
+import shutil       # Moving files
+import csv          # Batch report
+import os           # File names
+import formPipeline     # Background form parsing
+import formIndex        # Duplicate forms
+import function as fn
+from function import var
+
+
+def main():
+    """
+    Unattended `forms`: parses every form in the input directory and sorts
+    forms passing var["batch_rules"] into their district directory without
+    asking. Forms that break a rule stay in the input directory for `forms`,
+    badly formatted ones go to formatting issues. Every decision is written
+    to a CSV report in the input directory.
+    """
+    db_file = var["db_file"]
+    input_dir = var["input_dir"]
+    rules = var["batch_rules"]
+    formatting_dir = fn.initNestedDir(input_dir, "formatting issues")
+    duplicates_dir = fn.initNestedDir(input_dir, "duplicates")
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H-%M-%S")
+    report_file = os.path.join(input_dir, f"batch report {timestamp}.csv")
+    files_written = 0
+    for_review_count = 0
+    incorrect_format_count = 0
+    accepted_accounts = {}
+
+    file_list = fn.scanFiles(input_dir, [".docx", ".pdf"])
+    file_list = (fn.sanitizeFilename(file) for file in file_list)
+    # Copies of a form seen before are set aside without parsing
+    form_index = formIndex.FormIndex(var["form_index_path"])
+    dedup = formIndex.FormDeduplicator(form_index, duplicates_dir)
+    file_list = dedup.filterFiles(file_list)
+    # Nobody is waiting on a form, parse as many at once as there are cores
+    pipeline = formPipeline.FormPipeline(
+        file_list,
+        timeout=var["form_timeout"],
+        memory_limit=var["form_memory_limit"],
+    )
+
+    print("🔵 Connecting to Database")
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+    report = open(report_file, mode='w', newline='', encoding='utf-8')
+    writer = csv.writer(report)
+    writer.writerow(["File", "Decision", "District", "Students", "Reasons"])
+
+    try:
+        for result in pipeline:
+            if dedup.checkResult(result):
+                writer.writerow([result["file"], "Duplicate", "", len(result["student_data"]), ""])
+                continue  # Skip to next iteration
+            row = sortResult(result, rules, cursor, accepted_accounts, input_dir, formatting_dir)
+            writer.writerow(row)
+
+            decision = row[1]
+            if decision in ("Accepted", "Formatting"):
+                dedup.register(row[0], result["content_hash"], decision == "Accepted")
+            if decision == "Accepted":
+                files_written += 1
+            elif decision == "Review":
+                for_review_count += 1
+            else:
+                incorrect_format_count += 1
+
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+
+    # -------------------------------------------------------------- [ REPORT ]
+
+    finally:
+        pipeline.close()
+        report.close()
+        form_index.close()
+        print("🔵 Closing DB")
+        conn.close()
+        print("")
+        horizontal_line = "-" * 80
+        print(horizontal_line)
+        print("BATCH REPORT".center(80))
+        print(horizontal_line)
+        print(f"Files Accepted    : {files_written}".center(80))
+        print(f"For Review        : {for_review_count}".center(80))
+        print(f"Formatting Issues : {incorrect_format_count}".center(80))
+        print(f"Duplicates        : {dedup.count}".center(80))
+        print(horizontal_line)
+        print(f"📄 {report_file}")
+
+
+def sortResult(result, rules, cursor, accepted_accounts, input_dir, formatting_dir, auto_accept=True):
+    """
+    Arguments: (result, rules, cursor, accepted_accounts, input_dir, formatting_dir, auto_accept)
+        - result: Parsed form from the FormPipeline
+        - rules, cursor, accepted_accounts: As for fn.getAutoAcceptIssues()
+        - auto_accept: False only checks the rules, every form is left for review
+
+    Moves the form to formatting_dir if it isn't parsable, into its district
+    directory if it passes the rules, else leaves it in the input directory.
+
+    Returns: Report row [file (where it is now), decision, district,
+             student count, reasons] with decision "Formatting", "Accepted", "Review" or "Ready"
+             (passed the rules, left for review as auto_accept is off)
+    """
+    file = result["file"]
+    student_count = len(result["student_data"])
+
+    # -------------------------------------------- [ INCORRECT FORMATTING ]
+
+    if result["error"] or not result["correct"]:
+        reason = result["error"] or "Formatting error detected"
+        print(f"❌ {os.path.basename(file)}: {reason}")
+        fn.logFormattingIssue(formatting_dir, file, reason)
+        file = shutil.move(file, formatting_dir)
+        return [file, "Formatting", "", student_count, reason]
+
+    # ---------------------------------------------------- [ AUTO ACCEPT ]
+
+    district = result["district_guess"]
+    issues = fn.getAutoAcceptIssues(result, rules, cursor, accepted_accounts)
+
+    if issues:
+        print(f"⚠️ {os.path.basename(file)}: {'; '.join(issues)}")
+        return [file, "Review", district, student_count, "; ".join(issues)]
+
+    if not auto_accept:
+        print(f"🟢 {os.path.basename(file)}: Ready for review ({district})")
+        return [file, "Ready", district, student_count, ""]
+
+    file = fn.renameFilenameToInstitution(file, result["institution"])
+    output_dir = fn.initNestedDir(input_dir, district)
+    file = shutil.move(file, output_dir)
+    for value in result["student_data"].values():
+        accepted_accounts[value[3]] = os.path.basename(file)
+    print(f"✅ {os.path.basename(file)} -> {district}")
+    return [file, "Accepted", district, student_count, ""]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import sqlite3      # SQLite DB operations
+import datetime     # ISO Date format
+import json         # Change log
+from pathlib import Path            # OS Independent filepath
+from pandas import DataFrame        # Printing Tables
+import tabulate     # CLI Table Borders
+import ifscIndex    # Compiled IFSC snapshot
+import function as fn
+from function import var
+
+
+def main():
+    csv_file = var["ifsc_dataset_path"]
+    index_file = var["ifsc_index_path"]
+    district_list = var["district_dataset"]
+
+    print("📝 Path to new RazorPay IFSC.csv release")
+    new_csv_file = Path(input("> ").strip().strip('"'))
+    if not new_csv_file.is_file():
+        print(f"❌ File not found: {new_csv_file}")
+        return
+
+    # Nothing to diff against, compile the release as is
+    if not Path(csv_file).exists():
+        print("ℹ️ No current dataset, installing new release")
+        dataset = fn.loadIfscDataset(new_csv_file)
+        dataset.buildDistrictTable(district_list)
+        ifscIndex.installIfscRelease(new_csv_file, csv_file, index_file, dataset)
+        print("✅ IFSC Dataset installed")
+        return
+
+    # -------------------------------------------------------------- [ DIFF ]
+
+    print("🔵 Loading current IFSC Dataset")
+    dataset = ifscIndex.loadIfscIndex(
+        csv_file, index_file, fn.loadIfscDataset, district_list
+    )
+
+    print("🔵 Comparing with new release")
+    delta = dataset.diffRecords(ifscIndex.readIfscCsv(new_csv_file))
+    print(f"Added   : {len(delta['added'])}")
+    print(f"Removed : {len(delta['removed'])}")
+    print(f"Changed : {len(delta['changed'])}")
+
+    if not (delta["added"] or delta["removed"] or delta["changed"]):
+        print("✅ IFSC Dataset already up to date")
+        return
+
+    # ------------------------------------------------------------- [ APPLY ]
+
+    print("🔵 Applying changes")
+    new_dataset = dataset.applyDelta(delta)
+    changes = getIfscChanges(dataset, new_dataset, delta, district_list)
+    ifscIndex.installIfscRelease(new_csv_file, csv_file, index_file, new_dataset)
+    print("✅ IFSC Dataset updated")
+
+    # ---------------------------------------------------- [ AFFECTED STUDENTS ]
+
+    print("ℹ️ Connecting to Database")
+    conn = sqlite3.connect(var["db_file"])
+    try:
+        affected = getAffectedStudents(conn, changes)
+    finally:
+        print("ℹ️ Closing DB")
+        conn.close()
+
+    printAffectedStudents(affected)
+
+    change_file = saveIfscChanges(var["ifsc_changes_dir"], changes, affected)
+    print(f"📝 Changes recorded in {change_file}")
+
+
+def getIfscChanges(old_dataset, new_dataset, delta, district_list):
+    """
+    Arguments: (old_dataset, new_dataset, delta, district_list)
+        old_dataset: IfscStore before the update
+        new_dataset: IfscStore after applyDelta()
+        delta: Output of old_dataset.diffRecords()
+        district_list: District Dataset
+
+    Returns: A list of tuples for every changed IFSC code
+        data = [(ifsc, status, old_branch, new_branch, old_district, new_district)]
+
+    status is "added", "removed", or "changed" (Branch or District moved)
+    """
+    data = []
+
+    for ifsc in delta["removed"]:
+        old_branch = old_dataset[ifsc]["Branch"]
+        old_district = old_dataset.getDistrict(ifsc, district_list)
+        data.append((ifsc, "removed", old_branch, "", old_district, "Unknown"))
+
+    for ifsc in delta["added"]:
+        new_branch = new_dataset[ifsc]["Branch"]
+        new_district = new_dataset.getDistrict(ifsc, district_list)
+        data.append((ifsc, "added", "", new_branch, "Unknown", new_district))
+
+    for ifsc in delta["changed"]:
+        old_branch = old_dataset[ifsc]["Branch"]
+        new_branch = new_dataset[ifsc]["Branch"]
+        old_district = old_dataset.getDistrict(ifsc, district_list)
+        new_district = new_dataset.getDistrict(ifsc, district_list)
+        # Address or contact only changes do not matter to students
+        if old_branch != new_branch or old_district != new_district:
+            data.append((ifsc, "changed", old_branch, new_branch, old_district, new_district))
+
+    return data
+
+
+def getAffectedStudents(conn, changes):
+    """
+    Arguments: (conn, changes)
+        conn: Connection to database.db using sqlite3.connect()
+        changes: Output of getIfscChanges()
+
+    Returns: A list of tuples of Students rows using a changed IFSC code
+        data = [(student_id, school, name, ifsc, status, db_branch, new_branch, new_district)]
+
+    The changed codes are loaded into a temporary table and joined against
+    an index on Students.IFSC, so only the matching rows are visited.
+    """
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS StudentsIFSC ON Students (IFSC)")
+    cursor.execute("""
+    CREATE TEMP TABLE ChangedIFSC (
+        IFSC      TEXT PRIMARY KEY,
+        Status    TEXT,
+        Branch    TEXT,
+        District  TEXT
+    )
+    """)
+    cursor.executemany(
+        "INSERT OR REPLACE INTO ChangedIFSC VALUES (?, ?, ?, ?)",
+        [(ifsc, status, new_branch, new_district) for ifsc, status, _, new_branch, _, new_district in changes],
+    )
+
+    # CROSS JOIN keeps ChangedIFSC as the outer loop of the join
+    query = """
+    SELECT Students.StudentID, Schools.SchoolName, Students.StudentName,
+           Students.IFSC, ChangedIFSC.Status, Students.Branch,
+           ChangedIFSC.Branch, ChangedIFSC.District
+    FROM ChangedIFSC
+    CROSS JOIN Students ON Students.IFSC = ChangedIFSC.IFSC
+    LEFT JOIN Schools ON Schools.SchoolID = Students.SchoolID
+    ORDER BY ChangedIFSC.Status, Schools.SchoolName
+    """
+    cursor.execute(query)
+    data = cursor.fetchall()
+
+    conn.commit()
+    cursor.execute("DROP TABLE ChangedIFSC")
+    return data
+
+
+def printAffectedStudents(affected):
+    """
+    Prints: Table of Students rows flagged by getAffectedStudents()
+    """
+    if not affected:
+        print("✅ No students affected")
+        return
+
+    print(f"⚠️ {len(affected)} students affected:")
+    df = DataFrame(affected, columns=[
+        'ID', 'School', 'Name', 'IFSC', 'Status', 'DB Branch', 'New Branch', 'New District',
+    ])
+    print(tabulate.tabulate(df, headers='keys', tablefmt='rounded_outline', showindex=False))
+
+
+def saveIfscChanges(changes_dir, changes, affected):
+    """
+    Arguments: (changes_dir, changes, affected)
+    Returns: Path of JSON file recording the update
+    """
+    changes_dir = Path(changes_dir)
+    changes_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+    change_file = changes_dir / f"{timestamp}.json"
+
+    keys = ["ifsc", "status", "old_branch", "new_branch", "old_district", "new_district"]
+    record = {
+        "changes": [dict(zip(keys, change)) for change in changes],
+        "affected_students": [row[0] for row in affected],
+    }
+    with open(change_file, mode='w', encoding='utf-8') as file:
+        json.dump(record, file, indent=2)
+
+    return change_file
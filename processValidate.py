@@ -0,0 +1,144 @@
+import sqlite3      # SQLite DB operations
+import datetime     # Report file name
+import csv          # Validation report
+import json         # Validation report
+import os           # File names
+from collections import Counter     # Accounts shared between forms
+import formPipeline     # Background form parsing
+import function as fn
+from function import var
+
+# Columns of the validation report, one row per form
+REPORT_FIELDS = [
+    "File", "Format", "Students", "Invalid IFSC", "Unknown Class",
+    "In Database", "In Other Forms", "District", "District Share", "Problems",
+]
+
+
+def main():
+    """
+    Dry run of `forms` over the input directory: every form is format
+    checked, parsed, normalized and checked for duplicate accounts in
+    parallel, nothing is moved or renamed. Results go to a CSV and a JSON
+    report in the input directory.
+    """
+    db_file = var["db_file"]
+    input_dir = var["input_dir"]
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H-%M-%S")
+    report_file = os.path.join(input_dir, f"validation report {timestamp}")
+
+    # Nobody is waiting on a form, parse as many at once as there are cores
+    pipeline = formPipeline.FormPipeline(
+        fn.scanFiles(input_dir, [".docx", ".pdf"]),
+        timeout=var["form_timeout"],
+        memory_limit=var["form_memory_limit"],
+    )
+
+    print("🔵 Connecting to Database")
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+
+    rows = []
+    try:
+        for result in pipeline:
+            row = getValidationRow(result, cursor)
+            rows.append(row)
+            print(f"{'✅' if not row['Problems'] else '⚠️'} {row['File']}: {row['Problems'] or 'OK'}")
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+    finally:
+        pipeline.close()
+        print("🔵 Closing DB")
+        conn.close()
+
+    # Accounts turning up in more than one form of the intake
+    account_count = Counter(acc_no for row in rows for acc_no in set(row["accounts"]))
+    for row in rows:
+        shared = [acc_no for acc_no in row.pop("accounts") if account_count[acc_no] > 1]
+        row["In Other Forms"] = len(shared)
+        if shared:
+            row["Problems"] = "; ".join(filter(None, [row["Problems"], f"Accounts in other forms: {', '.join(shared)}"]))
+
+    with open(f"{report_file}.csv", mode='w', newline='', encoding='utf-8') as report:
+        writer = csv.DictWriter(report, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(f"{report_file}.json", mode='w', encoding='utf-8') as report:
+        json.dump(rows, report, indent=2, ensure_ascii=False)
+
+    # -------------------------------------------------------------- [ REPORT ]
+
+    print("")
+    horizontal_line = "-" * 80
+    print(horizontal_line)
+    print("VALIDATION REPORT".center(80))
+    print(horizontal_line)
+    print(f"Forms             : {len(rows)}".center(80))
+    print(f"Formatting Issues : {sum(row['Format'] != 'OK' for row in rows)}".center(80))
+    print(f"Invalid IFSC      : {sum(row['Invalid IFSC'] > 0 for row in rows)}".center(80))
+    print(f"Unknown Class     : {sum(row['Unknown Class'] > 0 for row in rows)}".center(80))
+    print(f"In Database       : {sum(row['In Database'] > 0 for row in rows)}".center(80))
+    print(f"In Other Forms    : {sum(row['In Other Forms'] > 0 for row in rows)}".center(80))
+    print(horizontal_line)
+    print(f"📄 {report_file}.csv")
+    print(f"📄 {report_file}.json")
+
+
+def getValidationRow(result, cursor):
+    """
+    Arguments: (result, cursor)
+        - result: Parsed form from formPipeline.parseForm()
+        - cursor: SQLite database cursor for the duplicate account check
+
+    Returns: Report row of REPORT_FIELDS, with counts as numbers so the
+             report sorts by them, plus the form's "accounts" for the
+             check across forms
+    """
+    file = str(result["file"])
+    student_data = result["student_data"]
+    acc_list = [value[3] for value in student_data.values()]
+    row = dict.fromkeys(REPORT_FIELDS, 0)
+    row["File"] = file
+    row["accounts"] = acc_list
+
+    problems = []
+    # Renamed by `forms` before parsing, a dry run can't parse it as is
+    if len(os.path.basename(file).split(".")) > 2:
+        problems.append("Extra dots in filename")
+
+    if result["error"] or not result["correct"]:
+        row["Format"] = result["error"] or "Formatting error detected"
+        row["District"] = ""
+        row["District Share"] = 0.0
+        row["Problems"] = "; ".join(problems + [row["Format"]])
+        return row
+
+    ifsc_list = fn.getStudentIfscList(student_data)
+    invalid_ifsc = [ifsc for ifsc, valid in zip(ifsc_list, result["ifsc_valid"]) if not valid]
+    unknown_class = [str(value[1]) for value in student_data.values() if type(value[1]) is not int]
+    existing = [account[2] for account in fn.getExistingAccounts(student_data, cursor)]
+    district = result["district_guess"]
+    districts = result["ifsc_districts"]
+
+    row["Format"] = "OK"
+    row["Students"] = len(student_data)
+    row["Invalid IFSC"] = len(invalid_ifsc)
+    row["Unknown Class"] = len(unknown_class)
+    row["In Database"] = len(existing)
+    row["District"] = district
+    row["District Share"] = round(districts.count(district) / len(districts), 2) if districts else 0.0
+
+    if not student_data:
+        problems.append("No students found")
+    if invalid_ifsc:
+        problems.append(f"IFSC not found: {', '.join(invalid_ifsc)}")
+    if unknown_class:
+        problems.append(f"Class not recognized: {', '.join(unknown_class)}")
+    if existing:
+        problems.append(f"Accounts in Database: {', '.join(existing)}")
+    row["Problems"] = "; ".join(problems)
+    return row
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import sys          # Optional form path argument
+import copy         # Cloning table rows
+import time         # Timing
+import tempfile     # Generated sample form
+from pathlib import Path            # OS Independent filepath
+import docx         # Docx generation and object model reader
+import formParser
+
+# Size of the generated sample form
+TABLE_COUNT = 8
+ROWS_PER_TABLE = 60
+# Times each reader parses the form (legacy reader is quadratic in rows)
+REPEAT = 1
+
+
+def makeSampleForm(docx_file, table_count, rows_per_table):
+    """
+    Writes a multi table student form in the layout of create_forms
+    """
+    doc = docx.Document()
+    doc.add_paragraph("Institution Details")
+    doc.add_paragraph("Name of the Institution: Govt. HSS Sample")
+    doc.add_paragraph("Place: Kollam")
+    doc.add_paragraph("Phone number: 0474 000000")
+    doc.add_paragraph("Email Id: sample@school.in")
+    doc.add_paragraph("Student Details")
+
+    header = ["STUDENT NAME", "CLASS", "IFSC", "ACCOUNT NO", "ACCOUNT HOLDER", "BRANCH"]
+    for t in range(table_count):
+        table = doc.add_table(rows=2, cols=len(header))
+        for column, text in enumerate(header):
+            table.cell(0, column).text = text
+        for column, text in enumerate(["Student", "7", "SBIN0001234", "1234567890", "Holder", "Kollam"]):
+            table.cell(1, column).text = text
+        # table.cell() slows down with size, clone the filled row instead
+        row = table.rows[1]._tr
+        for _ in range(rows_per_table - 1):
+            row.addnext(copy.deepcopy(row))
+        doc.add_paragraph(f"Table {t + 1}")
+
+    doc.save(docx_file)
+
+
+def legacyReadDocx(docx_file):
+    """
+    How the parsers used to read a DOCX: python-docx loaded once for each of
+    correctDocxFormat, getInstitutionDetailsDocx and getStudentDetailsDocx,
+    with row.cells rebuilt for every column read
+    """
+    for _ in range(2):
+        doc = docx.Document(docx_file)
+        [paragraph.text for paragraph in doc.paragraphs]
+
+    doc = docx.Document(docx_file)
+    data = []
+    for table in doc.tables:
+        for row in table.rows:
+            if row.cells[0].text != "":
+                data.append(tuple(row.cells[i].text for i in range(6)))
+    return data
+
+
+def timeReader(reader, docx_file):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = reader(docx_file)
+    return (time.perf_counter() - start) / REPEAT, result
+
+
+def main():
+    if len(sys.argv) > 1:
+        docx_file = Path(sys.argv[1])
+    else:
+        docx_file = Path(tempfile.mkdtemp()) / "sample.docx"
+        print(f"🔵 Generating {TABLE_COUNT} tables x {ROWS_PER_TABLE} rows form")
+        makeSampleForm(docx_file, TABLE_COUNT, ROWS_PER_TABLE)
+
+    legacy_time, _ = timeReader(legacyReadDocx, docx_file)
+    model_time, model = timeReader(formParser.readDocxObjectModel, docx_file)
+    stream_time, stream = timeReader(formParser.readDocx, docx_file)
+
+    print(f"Legacy (3 loads)    : {legacy_time:.3f}s")
+    print(f"python-docx (1 load): {model_time:.3f}s ({legacy_time / model_time:.1f}x)")
+    print(f"readDocx (stream)   : {stream_time:.3f}s ({legacy_time / stream_time:.1f}x)")
+    print(f"Same text as python-docx: {stream == model}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import random   # Raw class strings
+import time     # Timing
+import stdNormalizer
+from stdNormalizer import STD_ALIASES
+
+# Number of raw class strings to convert
+SAMPLE_SIZE = 300000
+
+
+def legacyConvertStdToNum(data):
+    """
+    convertStdToNum() before stdNormalizer: rebuilds the alias lists on every
+    call and compares against every alias of every class
+    """
+    data = str(data)
+    data = data.strip().lower()
+
+    std_dataset = {number: list(values) for number, values in STD_ALIASES.items()}
+    if isinstance(data, str):
+        data = data.lower()
+        for key, values in std_dataset.items():
+            for value in values:
+                if data == value:
+                    data = key
+    return data
+
+
+def getRawStandards(size):
+    """
+    Returns: List of class strings as they turn up on forms, mostly known
+    aliases in mixed case and padding, with some unseen variants mixed in
+    """
+    aliases = [value for values in STD_ALIASES.values() for value in values]
+    unseen = ["7th std", "VII-B", "Plus One", "Class 5", "IX - A", "std 10 c", "2nd year pg", "8.0"]
+    rng = random.Random(0)
+
+    data = []
+    for _ in range(size):
+        if rng.random() < 0.1:
+            value = rng.choice(unseen)
+        else:
+            value = rng.choice(aliases)
+        if rng.random() < 0.5:
+            value = value.upper()
+        if rng.random() < 0.2:
+            value = f" {value} "
+        data.append(value)
+    return data
+
+
+def main():
+    data = getRawStandards(SAMPLE_SIZE)
+    print(f"Converting {len(data)} class strings")
+
+    start = time.perf_counter()
+    legacy = [legacyConvertStdToNum(value) for value in data]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [stdNormalizer.convertStdToNum(value) for value in data]
+    single_time = time.perf_counter() - start
+
+    stdNormalizer.normalizer.cache.clear()
+    start = time.perf_counter()
+    batch = stdNormalizer.convertStdListToNum(data)
+    batch_time = time.perf_counter() - start
+
+    # Every known alias has to convert exactly like it used to
+    mismatch = sum(1 for old, new in zip(legacy, single) if isinstance(old, int) and old != new)
+    recovered = sum(1 for old, new in zip(legacy, single) if not isinstance(old, int) and isinstance(new, int))
+
+    print(f"Legacy              : {legacy_time:.3f}s")
+    print(f"convertStdToNum     : {single_time:.3f}s ({legacy_time / single_time:.0f}x)")
+    print(f"convertStdListToNum : {batch_time:.3f}s ({legacy_time / batch_time:.0f}x)")
+    print(f"Mismatches with legacy    : {mismatch}")
+    print(f"Unseen variants recovered : {recovered}")
+    assert batch == single
+
+
+if __name__ == "__main__":
+    main()
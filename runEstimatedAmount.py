@@ -27,9 +27,8 @@ def main():
             print(file)
             student_data = fn.getStudentDetails(file)
 
-            for _, value in student_data.items():
-                standard = value[1]
-                standard = fn.convertStdToNum(standard)
+            standard_list = [value[1] for value in student_data.values()]
+            for standard in fn.convertStdListToNum(standard_list):
                 amt = fn.convertStdToAmount(standard)
                 total_amt += amt
 
@@ -0,0 +1,53 @@
+import sqlite3  # SQLite DB operations
+import function as fn
+from function import var
+
+
+def main():
+    """
+    Re-validates the IFSC of every student in the database in a single pass
+    and lists the rows whose IFSC is unknown or whose Branch is outdated
+    """
+    db_file = var["db_file"]
+    fn.updateIfscInVar()
+    ifsc_dataset = var["ifsc_dataset"]
+
+    print("ℹ️ Connecting to Database")
+    conn = sqlite3.connect(db_file)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT StudentID, StudentName, IFSC, Branch FROM Students")
+        students = cursor.fetchall()
+        ifsc_list = [student[2] for student in students]
+        details = fn.getIfscDetailsList(ifsc_list, ifsc_dataset)
+
+        invalid_list = []
+        outdated_list = []
+        for student, valid, branch in zip(students, details["valid"], details["branch"]):
+            student_id, name, ifsc, db_branch = student
+            if not valid:
+                invalid_list.append((student_id, name, ifsc, db_branch))
+            # Same rule normalizeStudentData() uses to accept RazorPay branch
+            elif branch and "," not in branch and len(branch) < 30 and db_branch != branch:
+                outdated_list.append((student_id, name, ifsc, f"{db_branch} -> {branch}"))
+
+        print(f"Students checked : {len(students)}")
+        print(f"Invalid IFSC     : {len(invalid_list)}")
+        for row in invalid_list:
+            print(" ❌ " + ", ".join(map(str, row)))
+        print(f"Branch changed   : {len(outdated_list)}")
+        for row in outdated_list:
+            print(" ⚠️ " + ", ".join(map(str, row)))
+
+    except KeyboardInterrupt:
+        print("Caught the Keyboard Interrupt ;D")
+
+    finally:
+        print("ℹ️ Closing DB")
+        cursor.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import json         # One entry per line
+import os           # fsync
+import datetime     # Entry time
+import shutil       # Moving forms
+from pathlib import Path            # OS Independent filepath
+
+
+# =========================== [ @JOURNAL_CLASSES ] =========================== #
+
+
+class SessionJournal:
+    """
+    Append only record of a `forms` / `database` run, flushed to disk on
+    every entry so it survives crashes and Ctrl+C. Forms are tracked by the
+    SHA-256 of their content, as they get renamed on the way:
+
+    {"hash": ..., "file": ..., "step": "parsed", "result": parseForm() result}
+    {"hash": ..., "file": ..., "step": "decided", "decision": "accept", ...}
+    {"hash": ..., "file": ..., "step": "committed"}
+    {"hash": ..., "file": ..., "step": "moved", "to": new path}
+
+    With a formIndex.FormIndex, every move is also noted in the index of
+    forms, for copies arriving later to be recognized.
+
+    A run that gets through all its forms deletes the journal with finish().
+    If one is left over, the next run resumes from it: parsed forms aren't
+    parsed again and decided forms aren't asked about again. Only decisions
+    of the earlier run count for that (getInterrupted()), so a copy of a
+    form met later in the same run is still decided on its own.
+    """
+
+    def __init__(self, journal_file, form_index=None):
+        self.journal_file = Path(journal_file)
+        self.form_index = form_index
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        self.steps = {}     # {hash: {step: entry}}
+
+        if self.journal_file.exists():
+            with open(self.journal_file, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Line cut short by a crash
+                    self.steps.setdefault(entry["hash"], {})[entry["step"]] = entry
+        self.resumed = len(self.steps) > 0
+        # Steps of the earlier run, before this run adds to them
+        self.previous = {digest: dict(steps) for digest, steps in self.steps.items()}
+        self.journal = open(self.journal_file, mode="a", encoding="utf-8")
+
+    def get(self, digest, step):
+        """
+        Returns: Journal entry of step for the form, None if not reached
+        """
+        return self.steps.get(digest, {}).get(step)
+
+    def getResumed(self, digest, step):
+        """
+        Returns: Journal entry of step for the form from the earlier run,
+                 None if that run didn't reach it
+        """
+        return self.previous.get(digest, {}).get(step)
+
+    def getInterrupted(self, digest):
+        """
+        Returns: "decided" entry of a form the earlier run decided on but
+                 didn't get to move, None if there is nothing to finish
+        """
+        decided = self.getResumed(digest, "decided")
+        if decided is None or self.get(digest, "moved") is not None:
+            return None
+        return decided
+
+    def getResult(self, digest):
+        """
+        Returns: parseForm() result journaled for the form, None if not parsed
+        """
+        entry = self.get(digest, "parsed")
+        if entry is None:
+            return None
+        return decodeResult(entry["result"])
+
+    def record(self, digest, file, step, **values):
+        """
+        Writes the step to disk before returning (nothing for a form without
+        a hash, eg: unreadable when the pipeline got to it)
+        """
+        if digest is None:
+            return
+        entry = {
+            "hash": digest,
+            "file": str(file),
+            "step": step,
+            "time": datetime.datetime.now().isoformat(timespec="seconds"),
+            **values,
+        }
+        self.journal.write(json.dumps(entry, default=str) + "\n")
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+        self.steps.setdefault(digest, {})[step] = entry
+
+    def move(self, digest, file, dest_dir, accepted=False):
+        """
+        Moves the form into dest_dir and journals where it went
+        (accepted: moved as an accepted form, for the index of forms)
+        Returns: New path of the form
+        """
+        new_file = shutil.move(file, dest_dir)
+        self.record(digest, file, "moved", to=new_file)
+        if self.form_index is not None and digest is not None:
+            parsed = self.get(digest, "parsed")
+            content_hash = parsed["result"].get("content_hash") if parsed else None
+            self.form_index.add(digest, content_hash, new_file, accepted)
+        return new_file
+
+    def close(self):
+        """
+        Keeps the journal for the next run to resume from
+        """
+        if not self.journal.closed:
+            self.journal.close()
+
+    def finish(self):
+        """
+        Deletes the journal of a run that went through all of its forms
+        """
+        self.close()
+        self.journal_file.unlink(missing_ok=True)
+
+
+# ========================== [ @JOURNAL_FUNCTIONS ] ========================== #
+
+
+def openSessionJournal(session_dir, name, form_index=None):
+    """
+    Arguments: (session_dir, name, form_index)
+        - session_dir: Directory of session journals (var["session_dir"])
+        - name: Name of the run (eg: "forms", "database Kollam")
+        - form_index: formIndex.FormIndex to note moved forms in (optional)
+    Returns: SessionJournal, resuming the last run of name if it was cut short
+    """
+    journal = SessionJournal(Path(session_dir) / f"{name}.jsonl", form_index)
+    if journal.resumed:
+        print(f"🔁 Resuming unfinished session ({len(journal.steps)} forms journaled)")
+    return journal
+
+
+def decodeResult(result):
+    """
+    Returns: parseForm() result read back from JSON, with integer student
+             keys and student tuples again
+    """
+    result = dict(result)
+    result["student_data"] = {
+        int(key): tuple(value) for key, value in result["student_data"].items()
+    }
+    return result
@@ -0,0 +1,388 @@
+import re           # Pattern rules for unseen variants
+
+# Spellings of every class seen on forms, class number -> aliases
+# 1 - 12: School, 13 - 15: Degree (DC), 16 - 17: Post Graduation (PG)
+STD_ALIASES = {
+    1: [
+        "1",
+        "1a",
+        "1b",
+        "1c",
+        "1d",
+        "1e",
+        "1 a",
+        "1 b",
+        "1 c",
+        "1 d",
+        "1 e",
+        "i",
+        "1st",
+        "one",
+        "first",
+    ],
+    2: [
+        "2",
+        "2a",
+        "2b",
+        "2c",
+        "2d",
+        "2e",
+        "2 a",
+        "2 b",
+        "2 c",
+        "2 d",
+        "2 e",
+        "ii",
+        "2nd",
+        "two",
+        "second",
+    ],
+    3: [
+        "3",
+        "3a",
+        "3b",
+        "3c",
+        "3d",
+        "3e",
+        "3 a",
+        "3 b",
+        "3 c",
+        "3 d",
+        "3 e",
+        "iii",
+        "3rd",
+        "three",
+        "third",
+    ],
+    4: [
+        "4",
+        "4a",
+        "4b",
+        "4c",
+        "4d",
+        "4e",
+        "4 a",
+        "4 b",
+        "4 c",
+        "4 d",
+        "4 e",
+        "iv",
+        "1v",
+        "4th",
+        "four",
+        "fourth",
+    ],
+    5: [
+        "5",
+        "5a",
+        "5b",
+        "5c",
+        "5d",
+        "5e",
+        "5 a",
+        "5 b",
+        "5 c",
+        "5 d",
+        "5 e",
+        "v",
+        "5th",
+        "five",
+        "fifth",
+    ],
+    6: [
+        "6",
+        "6a",
+        "6b",
+        "6c",
+        "6d",
+        "6e",
+        "6 a",
+        "6 b",
+        "6 c",
+        "6 d",
+        "6 e",
+        "vi",
+        "v1",
+        "six",
+        "6th",
+        "sixth",
+    ],
+    7: [
+        "7",
+        "7a",
+        "7b",
+        "7c",
+        "7d",
+        "7e",
+        "7 a",
+        "7 b",
+        "7 c",
+        "7 d",
+        "7 e",
+        "vii",
+        "v11",
+        "7th",
+        "seven",
+        "seventh",
+    ],
+    8: [
+        "8",
+        "8a",
+        "8b",
+        "8c",
+        "8d",
+        "8e",
+        "8 a",
+        "8 b",
+        "8 c",
+        "8 d",
+        "8 e",
+        "v111",
+        "viii",
+        "8th",
+        "eight",
+        "eighth",
+    ],
+    9: [
+        "9",
+        "9a",
+        "9b",
+        "9c",
+        "9d",
+        "9e",
+        "9 a",
+        "9 b",
+        "9 c",
+        "9 d",
+        "9 e",
+        "1x",
+        "ix",
+        "9th",
+        "nine",
+        "nineth",
+    ],
+    10: [
+        "10",
+        "10a",
+        "10b",
+        "10c",
+        "10d",
+        "10e",
+        "10 a",
+        "10 b",
+        "10 c",
+        "10 d",
+        "10 e",
+        "x",
+        "10th",
+        "ten",
+        "tenth",
+    ],
+    11: [
+        "11",
+        "x1",
+        "xi",
+        "11th",
+        "plus one",
+        "plusone",
+        "+1",
+        "+1 science",
+        "+1 commerce",
+        "+1 humanities",
+    ],
+    12: [
+        "12",
+        "x11",
+        "xii",
+        "12th",
+        "plus two",
+        "plustwo",
+        "+2",
+        "+2 science",
+        "+2 commerce",
+        "+2 humanities",
+    ],
+    13: [
+        "1 dc",
+        "1dc",
+        "i dc",
+        "idc",
+        "ist dc",
+        "1stdc",
+        "1st dc",
+    ],
+    14: [
+        "2 dc",
+        "2dc",
+        "ii dc",
+        "iidc",
+        "iind dc",
+        "2nddc",
+        "2nd dc",
+    ],
+    15: [
+        "3 dc",
+        "3dc",
+        "iii dc",
+        "iiidc",
+        "iiird dc",
+        "3rddc",
+        "3rd dc",
+    ],
+    16: [
+        "1 pg",
+        "1pg",
+        "i pg",
+        "ipg",
+        "ist pg",
+        "1st pg",
+        "1stpg",
+    ],
+    17: [
+        "2 pg",
+        "2pg",
+        "ii pg",
+        "iipg",
+        "iind pg",
+        "2ndpg",
+        "2nd pg",
+    ],
+}
+
+
+# Words ignored around the class (eg: "7th Std", "Class VII", "Grade 7")
+FILLER_WORDS = {"std", "standard", "class", "grade", "div", "division", "sec", "section"}
+# Characters separating class and division (eg: "VII-B", "7/B", "(7)")
+SEPARATORS = re.compile(r"[-_./,:()\[\]]+")
+WORD_NUMBERS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5, "sixth": 6,
+    "seventh": 7, "eighth": 8, "ninth": 9, "nineth": 9, "tenth": 10,
+    "eleventh": 11, "twelfth": 12,
+}
+ROMAN_NUMBERS = {
+    "i": 1, "ii": 2, "iii": 3, "iv": 4, "v": 5, "vi": 6,
+    "vii": 7, "viii": 8, "ix": 9, "x": 10, "xi": 11, "xii": 12,
+}
+# Number written as digits, ordinal, roman numeral or word
+NUMBER = r"(\d{1,2})(?:st|nd|rd|th)?|(" + "|".join(sorted(ROMAN_NUMBERS, key=len, reverse=True)) + r")(?:st|nd|rd|th)?|(" + "|".join(WORD_NUMBERS) + ")"
+# "7", "7th", "VII", "Seven" followed by an optional division "B"
+SCHOOL_RULE = re.compile(rf"^(?:{NUMBER}) ?([a-h])?$")
+# "Plus One", "+1 Science", "Plus 2 Commerce"
+PLUS_RULE = re.compile(rf"^(?:\+|plus) ?(?:{NUMBER})(?: [a-z ]+)?$")
+# "1st DC", "II Degree", "2nd Year PG"
+COLLEGE_RULE = re.compile(rf"^(?:{NUMBER})(?: ?year)? ?(dc|degree|pg)$")
+
+
+# ============================ [ @STD_CLASSES ] ============================ #
+
+
+class StdNormalizer:
+    """
+    Converts the Standard written on forms into its class number.
+
+    Known spellings are answered from an inverted map built once from
+    STD_ALIASES, unseen ones are tried against the pattern rules, and every
+    answer is memoized by the raw value.
+    """
+
+    def __init__(self, aliases=STD_ALIASES):
+        self.aliases = {}
+        for number, values in aliases.items():
+            for value in values:
+                # First class listing an alias wins, like the old linear scan
+                self.aliases.setdefault(value, number)
+        self.cache = {}
+
+    def normalize(self, data):
+        """
+        Parameter: Student Standard / Class Number
+        Returns:
+            - Class number: If the Standard is recognised
+            - Stripped lowercase string: If it is not
+        """
+        key = str(data)
+        number = self.cache.get(key)
+        if number is None:
+            number = self.cache[key] = self.match(key.strip().lower())
+        return number
+
+    def normalizeMany(self, data_list):
+        """
+        Parameter: List or column of Student Standards
+        Returns: List of normalize() results, one per Standard
+        """
+        return [self.normalize(data) for data in data_list]
+
+    def match(self, data):
+        number = self.aliases.get(data)
+        if number is not None:
+            return number
+
+        words = SEPARATORS.sub(" ", data).split()
+        words = [word for word in words if word not in FILLER_WORDS]
+        text = " ".join(words)
+        number = self.aliases.get(text)
+        if number is not None:
+            return number
+
+        # Spreadsheet cells read as float (eg: "7.0")
+        if re.fullmatch(r"\d{1,2}\.0+", data):
+            number = int(data.split(".")[0])
+            return number if 1 <= number <= 12 else data
+
+        found = SCHOOL_RULE.match(text)
+        if found:
+            number = getNumber(found)
+            if 1 <= number <= 12:
+                return number
+
+        found = PLUS_RULE.match(text)
+        if found and getNumber(found) in (1, 2):
+            return 10 + getNumber(found)
+
+        found = COLLEGE_RULE.match(text)
+        if found:
+            number = getNumber(found)
+            if found.group(4) == "pg" and number in (1, 2):
+                return 15 + number
+            if found.group(4) != "pg" and number in (1, 2, 3):
+                return 12 + number
+
+        return data
+
+
+def getNumber(found):
+    """
+    Parameter: Match of a rule built on NUMBER
+    Returns: Value of whichever of digits / roman numeral / word matched
+    """
+    digits, roman, word = found.group(1, 2, 3)
+    if digits:
+        return int(digits)
+    if roman:
+        return ROMAN_NUMBERS[roman]
+    return WORD_NUMBERS[word]
+
+
+# =========================== [ @STD_FUNCTIONS ] =========================== #
+
+
+normalizer = StdNormalizer()
+
+
+def convertStdToNum(data):
+    """
+    Parameter: Student Standard / Class Number
+    Returns: Numeric Value if String
+    """
+    return normalizer.normalize(data)
+
+
+def convertStdListToNum(data_list):
+    """
+    Parameter: List or column of Student Standards
+    Returns: List of Numeric Values, one per Standard
+    """
+    return normalizer.normalizeMany(data_list)